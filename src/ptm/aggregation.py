@@ -2,7 +2,11 @@
 """Competitor pricing aggregation."""
 
 import re
+import sys
+from collections.abc import Iterator
 from difflib import SequenceMatcher
+from functools import lru_cache
+from itertools import islice
 from urllib.parse import urlparse
 
 from ptm.extraction import (
@@ -37,13 +41,10 @@ def aggregate_competitor_pricing(
 
     for source in sources:
         try:
-            domain = urlparse(str(source.url)).netloc
+            domain = _domain_of(str(source.url))
             if not domain:
                 continue
 
-            # Remove www. prefix for consistency
-            domain = domain.replace("www.", "")
-
             if domain not in domain_sources:
                 domain_sources[domain] = []
             domain_sources[domain].append(source)
@@ -52,87 +53,122 @@ def aggregate_competitor_pricing(
             continue
 
     # Build competitor pricing records
-    competitor_pricing_list: list[CompetitorPricing] = []
-
-    for domain, domain_source_list in domain_sources.items():
-        # Extract all content from this domain's sources
-        all_content = " ".join([s.content for s in domain_source_list if s.content])
-
-        if not all_content:
-            # No content, but still create record to flag as gap
-            competitor_pricing = CompetitorPricing(
-                domain=domain,
-                extracted_price_texts=[],
-                evidence_snippets=[],
-                gaps=["No pricing content found in sources"],
-            )
-            competitor_pricing_list.append(competitor_pricing)
-            continue
+    return [
+        _aggregate_one_domain(domain, domain_source_list, fx_rates, seat_count)
+        for domain, domain_source_list in domain_sources.items()
+    ]
 
-        # Extract pricing snippets
-        snippets = extract_pricing_snippets(domain_source_list)
 
-        # Extract price texts
-        price_texts = extract_price_texts(snippets)
-        
-        # Extract product attributes for better competitor matching
-        attributes = extract_product_attributes(domain_source_list)
-
-        # Try to parse and normalize prices
-        normalized_monthly_usd = None
-        cadence = None
-        gaps = []
-
-        # Try to normalize first valid price
-        # Use snippet context to help detect cadence
-        for price_text in price_texts:
-            # Find snippet containing this price text for context
-            context = None
-            for snippet in snippets:
-                if price_text.lower() in snippet.lower():
-                    context = snippet
-                    break
-            
-            parsed = parse_price(price_text, context=context)
-            if parsed:
-                normalized = normalize_to_monthly_usd(
-                    parsed, fx_rates=fx_rates, seat_count=seat_count
-                )
-                if normalized.gaps:
-                    gaps.extend(normalized.gaps)
-                else:
-                    # Only set normalized price if it's positive (no gaps)
-                    if normalized.monthly_usd > 0:
-                        normalized_monthly_usd = normalized.monthly_usd
-                        cadence = parsed.cadence  # Store cadence for reporting
-                        break  # Use first successfully normalized price
-                    else:
-                        gaps.extend(normalized.gaps)
+def _aggregate_one_domain(
+    domain: str,
+    domain_source_list: list[TavilySource],
+    fx_rates: dict[str, float] | None = None,
+    seat_count: int | None = None,
+) -> CompetitorPricing:
+    """Build the competitor pricing record for a single domain.
 
-        # If no normalized price, collect all gaps
-        if normalized_monthly_usd is None and not gaps:
-            gaps.append("Could not normalize any price (missing cadence, FX rate, or seat count)")
+    Args:
+        domain: Competitor domain
+        domain_source_list: Sources belonging to this domain
+        fx_rates: Optional FX rates for normalization
+        seat_count: Optional seat count for per-seat pricing
 
-        # Create competitor pricing record
-        competitor_pricing = CompetitorPricing(
+    Returns:
+        CompetitorPricing object for the domain
+    """
+    # Skip extraction entirely when none of this domain's sources has content
+    if not any(s.content for s in domain_source_list):
+        # No content, but still create record to flag as gap
+        return CompetitorPricing(
             domain=domain,
-            extracted_price_texts=price_texts,
-            evidence_snippets=snippets[:10],  # Limit to first 10 snippets
-            normalized_monthly_usd=normalized_monthly_usd,
-            cadence=cadence if 'cadence' in locals() else None,
-            gaps=gaps,
-            category=attributes.get("category"),
-            target_customer=attributes.get("target_customer"),
-            key_features=attributes.get("key_features", []),
-            product_description=attributes.get("product_description"),
-            problem_statement=attributes.get("problem_statement"),
-            decision_context=attributes.get("decision_context"),
-            payment_model=attributes.get("payment_model"),
+            extracted_price_texts=[],
+            evidence_snippets=[],
+            gaps=["No pricing content found in sources"],
         )
 
-        competitor_pricing_list.append(competitor_pricing)
+    # Extract pricing snippets
+    snippets = extract_pricing_snippets(domain_source_list)
+
+    # Extract price texts
+    price_texts = extract_price_texts(snippets)
+    
+    # Extract product attributes for better competitor matching
+    attributes = extract_product_attributes(domain_source_list)
+
+    # Try to parse and normalize prices
+    normalized_monthly_usd = None
+    cadence = None
+    gaps = []
+
+    # Try to normalize first valid price
+    # Use snippet context to help detect cadence
+    snippets_lower = [snippet.lower() for snippet in snippets]
+    for price_text in price_texts:
+        # Find snippet containing this price text for context
+        price_text_lower = price_text.lower()
+        context = next(
+            (
+                snippet
+                for snippet, snippet_lower in zip(snippets, snippets_lower, strict=True)
+                if price_text_lower in snippet_lower
+            ),
+            None,
+        )
+
+        parsed = parse_price(price_text, context=context)
+        if parsed:
+            normalized = normalize_to_monthly_usd(
+                parsed, fx_rates=fx_rates, seat_count=seat_count
+            )
+            if normalized.gaps:
+                gaps.extend(normalized.gaps)
+            else:
+                # Only set normalized price if it's positive (no gaps)
+                if normalized.monthly_usd > 0:
+                    normalized_monthly_usd = normalized.monthly_usd
+                    # Store cadence for reporting (as resolved by normalization)
+                    cadence = normalized.original_price.cadence
+                    break  # Use first successfully normalized price
+                else:
+                    gaps.extend(normalized.gaps)
+
+    # If no normalized price, collect all gaps
+    if normalized_monthly_usd is None and not gaps:
+        gaps.append("Could not normalize any price (missing cadence, FX rate, or seat count)")
+
+    # Create competitor pricing record
+    return CompetitorPricing(
+        domain=domain,
+        extracted_price_texts=price_texts,
+        evidence_snippets=snippets[:10],  # Limit to first 10 snippets
+        normalized_monthly_usd=normalized_monthly_usd,
+        cadence=cadence,
+        gaps=gaps,
+        category=attributes.get("category"),
+        target_customer=attributes.get("target_customer"),
+        key_features=attributes.get("key_features", []),
+        product_description=attributes.get("product_description"),
+        problem_statement=attributes.get("problem_statement"),
+        decision_context=attributes.get("decision_context"),
+        payment_model=attributes.get("payment_model"),
+    )
+
+
+@lru_cache(maxsize=8192)
+def _domain_of(url: str) -> str:
+    """Get the competitor domain for a URL.
+
+    Memoized because the same URLs recur across sources and aggregation runs.
+    The domain is interned so every record for a competitor shares one string.
+
+    Args:
+        url: Source URL
 
-    return competitor_pricing_list
+    Returns:
+        Domain without the www. prefix, or empty string if the URL has none
+    """
+    # Remove www. prefix for consistency
+    return sys.intern(urlparse(url).netloc.replace("www.", ""))
 
 
 def get_comparable_competitors(
@@ -147,6 +183,7 @@ def get_comparable_competitors(
     product_decision_context: str | None = None,
     product_payment_model: str | None = None,
     min_similarity_threshold: float = 0.4,  # Require at least 40% similarity (stricter)
+    limit: int | None = None,
 ) -> list[CompetitorPricing]:
     """Get competitors that belong to the same competitive group.
     
@@ -171,11 +208,19 @@ def get_comparable_competitors(
         product_decision_context: Optional decision context (who decides, when, why)
         product_payment_model: Optional payment model (subscription, one-time, etc.)
         min_similarity_threshold: Minimum similarity score required (default 0.4 = 40%)
+        limit: Optional maximum number of competitors to return. Scoring stops
+               as soon as this many comparable competitors have been found.
 
     Returns:
         List of competitors with normalized_monthly_usd set that solve the same problem,
         in the same decision context, with comparable price and payment model
+
+    Raises:
+        ValueError: If limit is negative
     """
+    if limit is not None and limit < 0:
+        raise ValueError("limit must be non-negative")
+
     # First filter: only competitors with normalized prices
     competitors_with_prices = [
         cp for cp in competitor_pricing_list 
@@ -184,7 +229,7 @@ def get_comparable_competitors(
     
     # If no current price provided, return all with normalized prices
     if current_price_usd is None or current_price_usd <= 0:
-        return competitors_with_prices
+        return competitors_with_prices[:limit]
     
     # Second filter: price similarity
     # If current price is very small (< $1), it might be usage-based pricing
@@ -198,10 +243,10 @@ def get_comparable_competitors(
         min_price = current_price_usd / price_similarity_factor
         max_price = current_price_usd * price_similarity_factor
     
-    price_filtered = [
+    price_filtered = (
         cp for cp in competitors_with_prices
         if min_price <= cp.normalized_monthly_usd <= max_price
-    ]
+    )
     
     # Third filter: competitive group matching
     # Products belong to the same competitive group when they:
@@ -216,59 +261,62 @@ def get_comparable_competitors(
     # This allows legacy matching to work when new attributes aren't extracted
     effective_threshold = min_similarity_threshold if has_competitive_group_attrs else 0.15
     
-    comparable = []
-    for cp in price_filtered:
-        # Calculate competitive group similarity
-        group_score = _calculate_competitive_group_similarity(
-            competitor=cp,
-            product_problem_statement=product_problem_statement,
-            product_decision_context=product_decision_context,
-            product_payment_model=product_payment_model,
-        )
-        
-        # Calculate legacy attribute similarity (for backward compatibility)
-        legacy_score = _calculate_attribute_similarity(
-            competitor=cp,
-            product_category=product_category,
-            product_target_customer=product_target_customer,
-            product_key_features=product_key_features,
-        )
-        
-        # Calculate name/keyword similarity bonus
-        name_bonus = 0.0
-        if product_name:
-            name_bonus = _calculate_name_similarity(cp.domain, product_name)
-        
-        # Combine scores: prioritize competitive group matching
-        if has_competitive_group_attrs:
-            # Use competitive group matching as primary
-            # If group_score is 0 (no matches), fall back more to legacy
-            if group_score > 0:
-                total_score = group_score + (legacy_score * 0.2) + (name_bonus * 0.1)
+    def _iter_comparable() -> Iterator[CompetitorPricing]:
+        for cp in price_filtered:
+            # Calculate competitive group similarity
+            group_score = _calculate_competitive_group_similarity(
+                competitor=cp,
+                product_problem_statement=product_problem_statement,
+                product_decision_context=product_decision_context,
+                product_payment_model=product_payment_model,
+            )
+
+            # Calculate legacy attribute similarity (for backward compatibility)
+            legacy_score = _calculate_attribute_similarity(
+                competitor=cp,
+                product_category=product_category,
+                product_target_customer=product_target_customer,
+                product_key_features=product_key_features,
+            )
+
+            # Calculate name/keyword similarity bonus
+            name_bonus = 0.0
+            if product_name:
+                name_bonus = _calculate_name_similarity(cp.domain, product_name)
+
+            # Combine scores: prioritize competitive group matching
+            if has_competitive_group_attrs:
+                # Use competitive group matching as primary
+                # If group_score is 0 (no matches), fall back more to legacy
+                if group_score > 0:
+                    total_score = group_score + (legacy_score * 0.2) + (name_bonus * 0.1)
+                else:
+                    # No competitive group matches, rely more on legacy
+                    total_score = (legacy_score * 0.7) + (name_bonus * 0.3)
             else:
-                # No competitive group matches, rely more on legacy
-                total_score = (legacy_score * 0.7) + (name_bonus * 0.3)
-        else:
-            # Fallback to legacy matching if new attributes not available
-            total_score = legacy_score + name_bonus
-        
-        # Filter out non-product domains
-        if _is_non_product_domain(cp.domain):
-            if total_score < 0.5 and name_bonus < 0.3:
-                continue
-        
-        # Include competitor if total score meets threshold
-        if total_score >= effective_threshold:
-            comparable.append(cp)
-        elif not has_competitive_group_attrs:
-            # Fallback: if no competitive group attributes, use legacy logic
-            has_attributes = cp.category or cp.target_customer or cp.key_features
-            if not has_attributes:
-                price_ratio = cp.normalized_monthly_usd / current_price_usd if current_price_usd else 1.0
-                if 0.5 <= price_ratio <= 2.0 or name_bonus >= 0.3:
-                    comparable.append(cp)
-    
-    return comparable
+                # Fallback to legacy matching if new attributes not available
+                total_score = legacy_score + name_bonus
+
+            # Filter out non-product domains
+            if _is_non_product_domain(cp.domain):
+                if total_score < 0.5 and name_bonus < 0.3:
+                    continue
+
+            # Include competitor if total score meets threshold
+            if total_score >= effective_threshold:
+                yield cp
+            elif not has_competitive_group_attrs:
+                # Fallback: if no competitive group attributes, use legacy logic
+                has_attributes = cp.category or cp.target_customer or cp.key_features
+                if not has_attributes:
+                    price_ratio = cp.normalized_monthly_usd / current_price_usd if current_price_usd else 1.0
+                    if 0.5 <= price_ratio <= 2.0 or name_bonus >= 0.3:
+                        yield cp
+
+    # Stream matches so scoring stops once the requested number is reached
+    if limit is not None:
+        return list(islice(_iter_comparable(), limit))
+    return list(_iter_comparable())
 
 
 def _calculate_competitive_group_similarity(
@@ -303,7 +351,7 @@ def _calculate_competitive_group_similarity(
         if competitor.problem_statement:
             problem_similarity = _calculate_text_similarity(
                 product_problem_statement.lower(),
-                competitor.problem_statement.lower()
+                competitor._lc_problem_statement
             )
             score += 0.4 * problem_similarity
         else:
@@ -311,7 +359,7 @@ def _calculate_competitive_group_similarity(
             if competitor.product_description:
                 desc_similarity = _calculate_text_similarity(
                     product_problem_statement.lower(),
-                    competitor.product_description.lower()
+                    competitor._lc_product_description
                 )
                 score += 0.4 * desc_similarity * 0.7  # Lower weight for description match
     
@@ -321,7 +369,7 @@ def _calculate_competitive_group_similarity(
         if competitor.decision_context:
             context_similarity = _calculate_text_similarity(
                 product_decision_context.lower(),
-                competitor.decision_context.lower()
+                competitor._lc_decision_context
             )
             score += 0.3 * context_similarity
         else:
@@ -329,7 +377,7 @@ def _calculate_competitive_group_similarity(
             if competitor.target_customer:
                 customer_match = _calculate_text_similarity(
                     product_decision_context.lower(),
-                    competitor.target_customer.lower()
+                    competitor._lc_target_customer
                 )
                 score += 0.3 * customer_match * 0.6  # Lower weight for fallback
     
@@ -447,12 +495,14 @@ def _calculate_attribute_similarity(
         total_checks += 1
         if competitor.category:
             # Case-insensitive comparison
-            if product_category.lower() == competitor.category.lower():
+            product_category_lower = product_category.lower()
+            competitor_category_lower = competitor._lc_category
+            if product_category_lower == competitor_category_lower:
                 score += 0.4
                 matches += 1
             # Partial match (substring)
-            elif product_category.lower() in competitor.category.lower() or \
-                 competitor.category.lower() in product_category.lower():
+            elif product_category_lower in competitor_category_lower or \
+                 competitor_category_lower in product_category_lower:
                 score += 0.2
                 matches += 1
     
@@ -460,12 +510,14 @@ def _calculate_attribute_similarity(
     if product_target_customer:
         total_checks += 1
         if competitor.target_customer:
-            if product_target_customer.lower() == competitor.target_customer.lower():
+            product_target_lower = product_target_customer.lower()
+            competitor_target_lower = competitor._lc_target_customer
+            if product_target_lower == competitor_target_lower:
                 score += 0.3
                 matches += 1
             # Partial match
-            elif product_target_customer.lower() in competitor.target_customer.lower() or \
-                 competitor.target_customer.lower() in product_target_customer.lower():
+            elif product_target_lower in competitor_target_lower or \
+                 competitor_target_lower in product_target_lower:
                 score += 0.15
                 matches += 1
     
@@ -475,7 +527,7 @@ def _calculate_attribute_similarity(
         if competitor.key_features:
             # Use fuzzy matching for features
             product_features_lower = [f.lower().strip() for f in product_key_features]
-            competitor_features_lower = [f.lower().strip() for f in competitor.key_features]
+            competitor_features_lower = competitor._lc_key_features
             
             # Calculate fuzzy similarity for each feature pair
             best_matches = []
@@ -3,9 +3,13 @@
 
 import os
 from pathlib import Path
+from typing import Any
 
 from dotenv import load_dotenv
 
+# Resolved configuration values, populated lazily and cleared by reload_config()
+_CACHE: dict[str, Any] = {}
+
 
 def load_config() -> None:
     """Load environment variables from .env file."""
@@ -13,6 +17,39 @@ def load_config() -> None:
     load_dotenv(env_path)
 
 
+def reload_config() -> None:
+    """Reload the .env file and drop all cached configuration values.
+
+    Call this after changing environment variables at runtime so that
+    subsequent getters pick up the new values.
+    """
+    _reset_cache()
+    load_config()
+
+
+def _reset_cache() -> None:
+    """Clear cached configuration values."""
+    _CACHE.clear()
+
+
+def _get_env(name: str, default: str | None = None) -> str | None:
+    """Get an environment variable, resolving it only once per cache lifetime.
+
+    Args:
+        name: Environment variable name
+        default: Value to use when the variable is not set
+
+    Returns:
+        Environment variable value or default.
+    """
+    if name in _CACHE:
+        return _CACHE[name]
+    if not _CACHE:
+        # First lookup since the cache was cleared: make sure .env is loaded
+        load_config()
+    return _CACHE.setdefault(name, os.getenv(name, default))
+
+
 def get_tavily_api_key() -> str:
     """Get Tavily API key from environment.
 
@@ -22,8 +59,7 @@ def get_tavily_api_key() -> str:
     Returns:
         Tavily API key.
     """
-    load_config()
-    key = os.getenv("TAVILY_API_KEY")
+    key = _get_env("TAVILY_API_KEY")
     if not key:
         raise ValueError(
             "TAVILY_API_KEY is required but not set. "
@@ -38,8 +74,7 @@ def get_openai_api_key() -> str | None:
     Returns:
         OpenAI API key if set, None otherwise.
     """
-    load_config()
-    return os.getenv("OPENAI_API_KEY")
+    return _get_env("OPENAI_API_KEY")
 
 
 def get_openai_model() -> str:
@@ -48,8 +83,7 @@ def get_openai_model() -> str:
     Returns:
         OpenAI model name, defaults to 'gpt-4' if not set.
     """
-    load_config()
-    return os.getenv("OPENAI_MODEL", "gpt-4")
+    return _get_env("OPENAI_MODEL", "gpt-4")
 
 
 def is_openai_available() -> bool:
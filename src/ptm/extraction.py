@@ -2,12 +2,139 @@
 """Rule-based pricing snippet extraction (NO LLM hallucination)."""
 
 import re
+from typing import Any
 
 from ptm.schemas import TavilySource
 
+try:
+    # Optional: RE2 matches in linear time, avoiding backtracking blowups on large pages
+    import re2 as _attribute_re
+except ImportError:
+    _attribute_re = re
+
 # Maximum snippet length to keep prompts safe
 MAX_SNIPPET_LENGTH = 500
 
+# Every pricing heuristic requires at least one digit, so content without
+# digits can be rejected with a single linear scan
+_DIGIT_RE = re.compile(r"\d")
+
+# Snippet heuristics, all case-insensitive
+# Pattern 1: Currency symbol followed by numbers
+# Matches: $99, €50, £30, ¥1000, etc.
+_CURRENCY_RE = re.compile(
+    r"[€$£¥₹]\s*\d+(?:[.,]\d+)?(?:\s*/\s*(?:month|year|mo|yr|day|wk))?", re.IGNORECASE
+)
+
+# Pattern 2: "starts at" or "from" with price
+_STARTS_AT_RE = re.compile(
+    r"(?:starts?\s+at|from|beginning\s+at)\s+[€$£¥₹]\s*\d+(?:[.,]\d+)?", re.IGNORECASE
+)
+
+# Pattern 3: "per month" / "per year" patterns
+_PER_PERIOD_RE = re.compile(
+    r"\d+(?:[.,]\d+)?\s*(?:USD|EUR|GBP|JPY|INR)?\s*(?:per|/)\s*(?:month|year|mo|yr|day|wk)",
+    re.IGNORECASE,
+)
+
+# Pattern 4: Price ranges (e.g., "$99-$199")
+_PRICE_RANGE_RE = re.compile(
+    r"[€$£¥₹]\s*\d+(?:[.,]\d+)?\s*[-–—]\s*[€$£¥₹]?\s*\d+(?:[.,]\d+)?", re.IGNORECASE
+)
+
+_SNIPPET_PATTERNS = [_CURRENCY_RE, _STARTS_AT_RE, _PER_PERIOD_RE, _PRICE_RANGE_RE]
+
+# Patterns that can only match where a currency symbol appears
+_CURRENCY_SNIPPET_PATTERNS = frozenset([_CURRENCY_RE, _STARTS_AT_RE, _PRICE_RANGE_RE])
+_CURRENCY_SYMBOL_RE = re.compile(r"[€$£¥₹]")
+
+# Keywords marking a line as pricing-related
+PRICING_KEYWORDS = ("price", "pricing", "cost", "plan", "tier", "subscription")
+
+# Currency or currency code next to a number, for keyword lines
+_LINE_PRICE_RE = re.compile(r"[€$£¥₹]\s*\d+|\d+\s*(?:USD|EUR|GBP|JPY|INR)")
+
+# Pattern to match price expressions (e.g. "$99", "€50 per month", "$10/mo")
+_PRICE_TEXT_RE = re.compile(
+    r"[€$£¥₹]\s*\d+(?:[.,]\d+)?(?:\s*(?:USD|EUR|GBP|JPY|INR)?\s*(?:per|/)\s*(?:month|year|mo|yr|day|wk))?",
+    re.IGNORECASE,
+)
+
+# Joins snippets for batch scanning
+_SNIPPET_SEPARATOR = "\x00"
+
+# Attribute heuristics, compiled with RE2 when available (inline (?i) works with both engines)
+_CATEGORY_PATTERN_SOURCES = [
+    (
+        r"(?i)(?:is|a|an)\s+(?:a|an)?\s*([a-z\s]+?)\s+(?:tool|platform|software|app|service|solution)",
+        ["tool", "platform", "software", "app", "service", "solution"],
+    ),
+    (r"(?i)(?:category|type|kind):\s*([a-z\s]+)", None),
+    (r"(?i)([a-z\s]+?)\s+software", ["software"]),
+    (r"(?i)([a-z\s]+?)\s+platform", ["platform"]),
+]
+
+_CUSTOMER_PATTERN_SOURCES = [
+    r"(?i)(?:for|targeting|designed for|built for)\s+([a-z\s]+?)(?:\.|,|$)",
+    r"(?i)(?:small business|enterprise|startup|individual|team|developer|designer|marketer)",
+]
+
+_FEATURE_PATTERN_SOURCES = [
+    r"(?i)(?:features?|includes?|offers?|provides?|supports?):\s*([^\.]+)",
+    r"(?i)(?:✓|•|–|—)\s*([^\.\n]+)",
+    r"(?i)(?:with|including)\s+([^\.]+)",
+]
+
+# Every character Python's Unicode \s matches, as RE2 character class ranges
+_RE2_WHITESPACE = (
+    r"\t-\r\x{1c}-\x{20}\x{85}\x{a0}\x{1680}\x{2000}-\x{200a}"
+    r"\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}"
+)
+
+
+def _compile_attribute_pattern(pattern: str, engine: Any) -> Any:
+    """Compile an attribute pattern so it matches the same text under re and RE2.
+
+    RE2's whitespace class only covers ASCII and its end anchor does not match
+    before a trailing newline, so both are spelled out for RE2 as Python re reads them.
+
+    Args:
+        pattern: Pattern source written for Python re
+        engine: The re module or the re2 module
+
+    Returns:
+        Compiled pattern
+    """
+    if engine is not re:
+        pattern = pattern.replace(r"\s]", _RE2_WHITESPACE + "]")
+        pattern = pattern.replace(r"\s", f"[{_RE2_WHITESPACE}]")
+        pattern = pattern.replace("$", r"\n?$")
+    return engine.compile(pattern)
+
+
+def _compile_attribute_patterns(engine: Any) -> tuple[list, list, list]:
+    """Compile the category, customer and feature patterns with the given engine.
+
+    Args:
+        engine: The re module or the re2 module
+
+    Returns:
+        Tuple of (category patterns with suffixes, customer patterns, feature patterns)
+    """
+    return (
+        [
+            (_compile_attribute_pattern(source, engine), suffixes)
+            for source, suffixes in _CATEGORY_PATTERN_SOURCES
+        ],
+        [_compile_attribute_pattern(source, engine) for source in _CUSTOMER_PATTERN_SOURCES],
+        [_compile_attribute_pattern(source, engine) for source in _FEATURE_PATTERN_SOURCES],
+    )
+
+
+_CATEGORY_PATTERNS, _CUSTOMER_PATTERNS, _FEATURE_PATTERNS = _compile_attribute_patterns(
+    _attribute_re
+)
+
 
 class ExtractionError(Exception):
     """Exception raised during extraction."""
@@ -27,27 +154,19 @@ def extract_pricing_snippets(sources: list[TavilySource]) -> list[str]:
     """
     snippets = []
 
-    for source in sources:
-        content = source.content
-        if not content:
+    # Read each model field once up front; the loop below only touches plain strings
+    contents = [source.content for source in sources]
+
+    for content in contents:
+        if not content or not _DIGIT_RE.search(content):
             continue
 
         # Extract snippets using heuristics
         extracted = _extract_with_heuristics(content)
         snippets.extend(extracted)
 
-    # Truncate snippets to safe length
-    truncated = [_truncate_snippet(s) for s in snippets]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_snippets = []
-    for snippet in truncated:
-        if snippet not in seen:
-            seen.add(snippet)
-            unique_snippets.append(snippet)
-
-    return unique_snippets
+    # Truncate snippets to safe length, then drop duplicates preserving order
+    return list(dict.fromkeys(_truncate_snippet(s) for s in snippets))
 
 
 def _extract_with_heuristics(content: str) -> list[str]:
@@ -67,31 +186,13 @@ def _extract_with_heuristics(content: str) -> list[str]:
     """
     snippets = []
 
-    # Pattern 1: Currency symbol followed by numbers
-    # Matches: $99, €50, £30, ¥1000, etc.
-    currency_pattern = r"[€$£¥₹]\s*\d+(?:[.,]\d+)?(?:\s*/\s*(?:month|year|mo|yr|day|wk))?"
-
-    # Pattern 2: "starts at" or "from" with price
-    starts_at_pattern = r"(?:starts?\s+at|from|beginning\s+at)\s+[€$£¥₹]\s*\d+(?:[.,]\d+)?"
+    # One cheap scan decides whether the currency-anchored patterns can match at all
+    has_currency = _CURRENCY_SYMBOL_RE.search(content) is not None
 
-    # Pattern 3: "per month" / "per year" patterns
-    per_period_pattern = (
-        r"\d+(?:[.,]\d+)?\s*(?:USD|EUR|GBP|JPY|INR)?\s*(?:per|/)\s*(?:month|year|mo|yr|day|wk)"
-    )
-
-    # Pattern 4: Price ranges (e.g., "$99-$199")
-    price_range_pattern = r"[€$£¥₹]\s*\d+(?:[.,]\d+)?\s*[-–—]\s*[€$£¥₹]?\s*\d+(?:[.,]\d+)?"
-
-    # Combine all patterns
-    all_patterns = [
-        currency_pattern,
-        starts_at_pattern,
-        per_period_pattern,
-        price_range_pattern,
-    ]
-
-    for pattern in all_patterns:
-        matches = re.finditer(pattern, content, re.IGNORECASE)
+    for pattern in _SNIPPET_PATTERNS:
+        if not has_currency and pattern in _CURRENCY_SNIPPET_PATTERNS:
+            continue
+        matches = pattern.finditer(content)
         for match in matches:
             # Extract context around the match (50 chars before and after)
             start = max(0, match.start() - 50)
@@ -101,15 +202,19 @@ def _extract_with_heuristics(content: str) -> list[str]:
             if snippet and len(snippet) > 10:  # Minimum snippet length
                 snippets.append(snippet)
 
-    # Also look for lines containing pricing keywords
+    # Also look for lines containing pricing keywords. Lowercase the whole
+    # content once and skip the per-line pass when no keyword appears at all.
+    content_lower = content.lower()
+    if not any(keyword in content_lower for keyword in PRICING_KEYWORDS):
+        return snippets
+
     lines = content.split("\n")
-    pricing_keywords = ["price", "pricing", "cost", "plan", "tier", "subscription"]
+    lines_lower = content_lower.split("\n")
 
-    for line in lines:
-        line_lower = line.lower()
-        if any(keyword in line_lower for keyword in pricing_keywords):
+    for line, line_lower in zip(lines, lines_lower, strict=True):
+        if any(keyword in line_lower for keyword in PRICING_KEYWORDS):
             # Check if line contains currency or numbers
-            if re.search(r"[€$£¥₹]\s*\d+|\d+\s*(?:USD|EUR|GBP|JPY|INR)", line):
+            if _LINE_PRICE_RE.search(line):
                 if line.strip() and len(line.strip()) > 10:
                     snippets.append(line.strip())
 
@@ -144,19 +249,13 @@ def extract_price_texts(snippets: list[str]) -> list[str]:
     Returns:
         List of extracted price texts
     """
-    price_texts = []
-
-    # Pattern to match price expressions
-    price_pattern = r"[€$£¥₹]\s*\d+(?:[.,]\d+)?(?:\s*(?:USD|EUR|GBP|JPY|INR)?\s*(?:per|/)\s*(?:month|year|mo|yr|day|wk))?"
-
-    for snippet in snippets:
-        matches = re.findall(price_pattern, snippet, re.IGNORECASE)
-        for match in matches:
-            price_text = match.strip()
-            if price_text and price_text not in price_texts:
-                price_texts.append(price_text)
+    # Scan all snippets in one pass. The separator cannot be matched by any
+    # part of the pattern (it is not whitespace), so matches never span snippets.
+    blob = _SNIPPET_SEPARATOR.join(snippets)
+    matches = (match.strip() for match in _PRICE_TEXT_RE.findall(blob))
 
-    return price_texts
+    # Remove duplicates while preserving order
+    return list(dict.fromkeys(match for match in matches if match))
 
 
 def extract_product_attributes(sources: list[TavilySource]) -> dict[str, str | list[str] | None]:
@@ -218,15 +317,6 @@ def _extract_category(content: str) -> str | None:
     """
     content_lower = content.lower()
     
-    # Common category patterns
-    category_patterns = [
-        (r"(?:is|a|an)\s+(?:a|an)?\s*([a-z\s]+?)\s+(?:tool|platform|software|app|service|solution)",
-         ["tool", "platform", "software", "app", "service", "solution"]),
-        (r"(?:category|type|kind):\s*([a-z\s]+)", None),
-        (r"([a-z\s]+?)\s+software", ["software"]),
-        (r"([a-z\s]+?)\s+platform", ["platform"]),
-    ]
-    
     # Common categories to look for
     known_categories = [
         "saas", "project management", "design", "crm", "marketing",
@@ -245,8 +335,8 @@ def _extract_category(content: str) -> str | None:
                 return category.title()
     
     # Try pattern matching
-    for pattern, suffixes in category_patterns:
-        matches = re.finditer(pattern, content_lower, re.IGNORECASE)
+    for pattern, suffixes in _CATEGORY_PATTERNS:
+        matches = pattern.finditer(content_lower)
         for match in matches:
             extracted = match.group(1).strip()
             if len(extracted) > 2 and len(extracted) < 50:
@@ -266,12 +356,6 @@ def _extract_target_customer(content: str) -> str | None:
     """
     content_lower = content.lower()
     
-    # Common target customer patterns
-    customer_patterns = [
-        r"(?:for|targeting|designed for|built for)\s+([a-z\s]+?)(?:\.|,|$)",
-        r"(?:small business|enterprise|startup|individual|team|developer|designer|marketer)",
-    ]
-    
     # Known customer segments
     known_segments = [
         "small business", "enterprise", "startup", "individual", "team",
@@ -286,8 +370,8 @@ def _extract_target_customer(content: str) -> str | None:
             return segment.title()
     
     # Try pattern matching
-    for pattern in customer_patterns:
-        matches = re.finditer(pattern, content_lower, re.IGNORECASE)
+    for pattern in _CUSTOMER_PATTERNS:
+        matches = pattern.finditer(content_lower)
         for match in matches:
             extracted = match.group(1).strip() if match.groups() else match.group(0).strip()
             if len(extracted) > 2 and len(extracted) < 50:
@@ -308,13 +392,6 @@ def _extract_key_features(content: str) -> list[str]:
     features = []
     content_lower = content.lower()
     
-    # Common feature indicators
-    feature_patterns = [
-        r"(?:features?|includes?|offers?|provides?|supports?):\s*([^\.]+)",
-        r"(?:✓|•|–|—)\s*([^\.\n]+)",
-        r"(?:with|including)\s+([^\.]+)",
-    ]
-    
     # Common features to look for
     known_features = [
         "collaboration", "real-time", "cloud", "mobile", "api", "integration",
@@ -324,8 +401,8 @@ def _extract_key_features(content: str) -> list[str]:
     ]
     
     # Extract from patterns
-    for pattern in feature_patterns:
-        matches = re.finditer(pattern, content_lower, re.IGNORECASE)
+    for pattern in _FEATURE_PATTERNS:
+        matches = pattern.finditer(content_lower)
         for match in matches:
             feature_text = match.group(1).strip()
             # Split by common separators
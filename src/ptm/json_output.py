@@ -1,12 +1,19 @@
 # -*- coding: utf-8 -*-
 """JSON output generator for automation."""
 
-import json
 from pathlib import Path
+from typing import Any
+
+import orjson
 
 from ptm.schemas import PricingVerdict
 
 
+def _json_default(obj: Any) -> str:
+    """Serialize values orjson does not handle natively as strings."""
+    return str(obj)
+
+
 def generate_json_report(verdict: PricingVerdict, output_path: Path) -> None:
     """Generate machine-readable JSON report.
 
@@ -30,15 +37,15 @@ def generate_json_report(verdict: PricingVerdict, output_path: Path) -> None:
         },
     }
 
-    # Write JSON with pretty formatting
+    # Write JSON with pretty formatting (orjson emits UTF-8 without escaping)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8") as f:
-        json.dump(report_data, f, indent=2, ensure_ascii=False, default=str)
+    output_path.write_bytes(
+        orjson.dumps(report_data, default=_json_default, option=orjson.OPT_INDENT_2)
+    )
 
     # Validate that output conforms to schema by loading it back
     # This ensures the JSON is valid and can be parsed
-    with output_path.open("r", encoding="utf-8") as f:
-        loaded = json.load(f)
+    loaded = orjson.loads(output_path.read_bytes())
 
     # Verify structure
     assert "verdict" in loaded
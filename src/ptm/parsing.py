@@ -2,7 +2,7 @@
 """Money parsing and cadence detection (NO silent normalization)."""
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 # Currency symbols mapping
 CURRENCY_SYMBOLS = {
@@ -13,6 +13,14 @@ CURRENCY_SYMBOLS = {
     "₹": "INR",
 }
 
+# Amount formats: US (1,234.56), EU (1.234,56) and a plain-number fallback
+_US_AMOUNT_RE = re.compile(r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?)")
+_EU_AMOUNT_RE = re.compile(r"(\d{1,3}(?:\.\d{3})*(?:,\d+)?)")
+_SIMPLE_AMOUNT_RE = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+# ISO currency codes (USD, EUR, etc.)
+_CURRENCY_CODE_RE = re.compile(r"\b(USD|EUR|GBP|JPY|INR)\b", re.IGNORECASE)
+
 # FX rates (can be configured, defaults to 1.0 if not provided)
 # In production, these should come from a real-time source or config
 DEFAULT_FX_RATES = {
@@ -23,8 +31,21 @@ DEFAULT_FX_RATES = {
     "INR": 0.012,  # Example: 1 INR = 0.012 USD
 }
 
+# Factor converting a price at each cadence to a monthly amount
+_MONTHLY_MULTIPLIERS = {
+    "month": 1.0,
+    "year": 1 / 12,
+    "day": 30.0,  # Approximate
+    "week": 4.33,  # Approximate
+    # One-time purchases keep the full amount so they compare with other one-time prices
+    "one-time": 1.0,
+    # Usage-based pricing assumes moderate usage of 100 units/month (per-image/call
+    # pricing), which allows comparison with subscription-based competitors
+    "usage-based": 100.0,
+}
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class ParsedPrice:
     """Parsed price information."""
 
@@ -71,7 +92,7 @@ def parse_price(text: str, context: str | None = None) -> ParsedPrice | None:
     # Try to extract amount
     # Handle both formats: $1,234.56 (US) and €1.234,56 (EU)
     # First try US format (comma as thousands, dot as decimal)
-    us_format_match = re.search(r"(\d{1,3}(?:,\d{3})*(?:\.\d+)?)", text)
+    us_format_match = _US_AMOUNT_RE.search(text)
     if us_format_match:
         try:
             amount_str = us_format_match.group(1).replace(",", "")
@@ -87,7 +108,7 @@ def parse_price(text: str, context: str | None = None) -> ParsedPrice | None:
 
     # If US format didn't work, try EU format (dot as thousands, comma as decimal)
     if not us_format_match:
-        eu_format_match = re.search(r"(\d{1,3}(?:\.\d{3})*(?:,\d+)?)", text)
+        eu_format_match = _EU_AMOUNT_RE.search(text)
         if eu_format_match:
             try:
                 amount_str = eu_format_match.group(1).replace(".", "").replace(",", ".")
@@ -96,7 +117,7 @@ def parse_price(text: str, context: str | None = None) -> ParsedPrice | None:
                 return None
         else:
             # Fallback to simple number
-            simple_match = re.search(r"(\d+(?:[.,]\d+)?)", text)
+            simple_match = _SIMPLE_AMOUNT_RE.search(text)
             if not simple_match:
                 return None
             try:
@@ -113,7 +134,7 @@ def parse_price(text: str, context: str | None = None) -> ParsedPrice | None:
             break
 
     # Check for currency codes (USD, EUR, etc.)
-    currency_code_match = re.search(r"\b(USD|EUR|GBP|JPY|INR)\b", text, re.IGNORECASE)
+    currency_code_match = _CURRENCY_CODE_RE.search(text)
     if currency_code_match:
         currency = currency_code_match.group(1).upper()
 
@@ -205,7 +226,7 @@ def normalize_to_monthly_usd(
     if not parsed_price.cadence:
         # For prices without explicit cadence, assume one-time purchase
         # This allows comparison of physical products and one-time purchases
-        parsed_price.cadence = "one-time"
+        parsed_price = replace(parsed_price, cadence="one-time")
 
     # Check FX rate
     if parsed_price.currency not in fx_rates:
@@ -234,25 +255,8 @@ def normalize_to_monthly_usd(
     fx_rate = fx_rates[parsed_price.currency]
     amount_usd = amount * fx_rate
 
-    # Step 2: Convert to monthly
-    if parsed_price.cadence == "year":
-        amount_monthly = amount_usd / 12
-    elif parsed_price.cadence == "day":
-        amount_monthly = amount_usd * 30  # Approximate
-    elif parsed_price.cadence == "week":
-        amount_monthly = amount_usd * 4.33  # Approximate
-    elif parsed_price.cadence == "one-time":
-        # For one-time purchases, we keep the full amount (no conversion to monthly)
-        # This allows comparison of one-time prices with one-time prices
-        amount_monthly = amount_usd
-    elif parsed_price.cadence == "usage-based":
-        # For usage-based pricing, estimate monthly usage
-        # Assume moderate usage: 100 units/month for per-image/call pricing
-        # This allows comparison with subscription-based competitors
-        estimated_monthly_usage = 100
-        amount_monthly = amount_usd * estimated_monthly_usage
-    else:  # month
-        amount_monthly = amount_usd
+    # Step 2: Convert to monthly (unknown cadences are treated as monthly)
+    amount_monthly = amount_usd * _MONTHLY_MULTIPLIERS.get(parsed_price.cadence, 1.0)
 
     # Step 3: Multiply by seat count if per-seat
     if parsed_price.per_seat and seat_count:
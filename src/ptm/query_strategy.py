@@ -1,11 +1,28 @@
 # -*- coding: utf-8 -*-
 """Query strategy for pricing discovery via Tavily."""
 
+from functools import lru_cache
 from urllib.parse import urlparse
 
 from ptm.schemas import ProductInput, TavilySource
 from ptm.tavily_client import TavilyClient
 
+PRICING_URL_KEYWORDS = ("/pricing", "/plans", "price", "pricing")
+
+
+@lru_cache(maxsize=8192)
+def _is_pricing_url(url: str) -> bool:
+    """Check whether a URL looks like a pricing page.
+
+    Args:
+        url: URL string
+
+    Returns:
+        True if the URL contains a pricing keyword.
+    """
+    url_lower = url.lower()
+    return any(keyword in url_lower for keyword in PRICING_URL_KEYWORDS)
+
 
 class QueryStrategy:
     """Strategy for generating pricing-related search queries."""
@@ -161,25 +178,25 @@ class QueryStrategy:
         Returns:
             Filtered list of TavilySource objects
         """
-        pricing_keywords = ["/pricing", "/plans", "price", "pricing"]
-        filtered = []
+        pricing = []
+        others = []
 
         for source in sources:
-            url_str = str(source.url).lower()
-
-            # Check if URL contains pricing keywords
-            is_pricing_url = any(keyword in url_str for keyword in pricing_keywords)
+            # Hash the plain string once rather than comparing URL objects
+            url_str = str(source.url)
 
             # Check if we've seen this URL before
-            if str(source.url) in seen_urls:
+            if url_str in seen_urls:
                 continue
 
-            seen_urls.add(str(source.url))
+            seen_urls.add(url_str)
 
             # Prioritize pricing URLs, but include others too
-            if is_pricing_url:
-                filtered.insert(0, source)  # Add pricing URLs at the beginning
+            if _is_pricing_url(url_str):
+                pricing.append(source)
             else:
-                filtered.append(source)
+                others.append(source)
 
-        return filtered
+        # Pricing URLs go first, most recent first, as they always have
+        pricing.reverse()
+        return pricing + others
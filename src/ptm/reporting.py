@@ -10,17 +10,31 @@ from ptm.schemas import PricingVerdict, VerdictStatus
 def generate_markdown_report(verdict: PricingVerdict, output_path: Path) -> None:
     """Generate human-readable Markdown report.
 
+    Args:
+        verdict: Pricing verdict
+        output_path: Path to write report.md
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(render_markdown_report(verdict), encoding="utf-8")
+
+
+def render_markdown_report(verdict: PricingVerdict) -> str:
+    """Render the human-readable Markdown report.
+
     Sections:
     - Inputs
     - Evidence summary
     - Competitor comparison table
     - Verdict
+    - Gaps
     - Recommendation (verbal recommendation based on verdict)
     - Citations
 
     Args:
         verdict: Pricing verdict
-        output_path: Path to write report.md
+
+    Returns:
+        Report content as Markdown
     """
     product = verdict.evidence_bundle.product_input
 
@@ -154,6 +168,17 @@ def generate_markdown_report(verdict: PricingVerdict, output_path: Path) -> None
 
     report_lines.append("")
 
+    if verdict.gaps:
+        report_lines.extend(
+            [
+                "### ⚠️ Gaps",
+                "",
+            ]
+        )
+        for gap in verdict.gaps:
+            report_lines.append(f"- {gap}")
+        report_lines.append("")
+
     # Recommendation with enhanced formatting
     recommendation = _generate_recommendation(verdict)
     if recommendation:
@@ -209,10 +234,7 @@ def generate_markdown_report(verdict: PricingVerdict, output_path: Path) -> None
         ]
     )
 
-    # Write report
-    report_content = "\n".join(report_lines)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(report_content, encoding="utf-8")
+    return "\n".join(report_lines)
 
 
 def _generate_recommendation(verdict: PricingVerdict) -> str:
@@ -1,9 +1,22 @@
 # -*- coding: utf-8 -*-
 """Pydantic schemas for Pricing Truth Machine."""
 
+from collections.abc import Mapping
 from enum import Enum
+from typing import Any
 
-from pydantic import BaseModel, Field, HttpUrl, field_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    HttpUrl,
+    PrivateAttr,
+    TypeAdapter,
+    field_validator,
+)
+
+# Validates URLs held as plain strings
+_HTTP_URL = TypeAdapter(HttpUrl)
 
 
 class VerdictStatus(str, Enum):
@@ -18,8 +31,14 @@ class VerdictStatus(str, Enum):
 class ProductInput(BaseModel):
     """Input schema for product information."""
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Product name")
-    url: HttpUrl = Field(..., description="Product URL")
+    url: str = Field(
+        ...,
+        description="Product URL",
+        json_schema_extra={"format": "uri", "minLength": 1, "maxLength": 2083},
+    )
     current_price: str = Field(..., description="Current price as string (e.g., '$99/month')")
     competitor_urls: list[HttpUrl] = Field(
         default_factory=list,
@@ -50,10 +69,18 @@ class ProductInput(BaseModel):
         description="Payment model (e.g., 'subscription', 'one-time', 'per-seat', 'usage-based', 'freemium')",
     )
 
+    @field_validator("url", mode="before")
+    @classmethod
+    def validate_url(cls, v: Any) -> str:
+        """Validate the URL (str or HttpUrl) and keep its normalized string form."""
+        return str(_HTTP_URL.validate_python(str(v)))
+
 
 class TavilySource(BaseModel):
     """Schema for Tavily search result source."""
 
+    model_config = ConfigDict(frozen=True)
+
     url: HttpUrl = Field(..., description="Source URL")
     title: str = Field(..., description="Page title")
     content: str = Field(..., description="Page content")
@@ -64,6 +91,8 @@ class TavilySource(BaseModel):
 class CompetitorPricing(BaseModel):
     """Schema for competitor pricing information."""
 
+    model_config = ConfigDict(frozen=True)
+
     domain: str = Field(..., description="Competitor domain")
     extracted_price_texts: list[str] = Field(
         default_factory=list,
@@ -115,6 +144,32 @@ class CompetitorPricing(BaseModel):
         description="Payment model (e.g., 'subscription', 'one-time', 'per-seat', 'usage-based')",
     )
 
+    # Lowercased attribute values used by competitor matching, computed once
+    _lc_category: str = PrivateAttr(default="")
+    _lc_target_customer: str = PrivateAttr(default="")
+    _lc_key_features: tuple[str, ...] = PrivateAttr(default=())
+    _lc_problem_statement: str = PrivateAttr(default="")
+    _lc_product_description: str = PrivateAttr(default="")
+    _lc_decision_context: str = PrivateAttr(default="")
+
+    def model_post_init(self, __context: Any) -> None:
+        """Precompute lowercased attributes for case-insensitive matching."""
+        self._lc_category = (self.category or "").lower()
+        self._lc_target_customer = (self.target_customer or "").lower()
+        self._lc_key_features = tuple(f.lower().strip() for f in self.key_features)
+        self._lc_problem_statement = (self.problem_statement or "").lower()
+        self._lc_product_description = (self.product_description or "").lower()
+        self._lc_decision_context = (self.decision_context or "").lower()
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> "CompetitorPricing":
+        """Copy the model, recomputing lowercased attributes when fields are updated."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
     @field_validator("normalized_monthly_usd")
     @classmethod
     def validate_normalized_price(cls, v: float | None) -> float | None:
@@ -178,3 +233,7 @@ class PricingVerdict(BaseModel):
         if not 0.0 <= v <= 1.0:
             raise ValueError("Confidence must be between 0.0 and 1.0")
         return v
+
+
+# Validator for whole source lists, built once so bulk ingestion is a single call
+SOURCE_LIST = TypeAdapter(list[TavilySource])
@@ -1,9 +1,11 @@
 # -*- coding: utf-8 -*-
 """Tavily search client for real-time web data retrieval."""
 
-from urllib.parse import urlparse
+import re
 
 import httpx
+import orjson
+from pydantic import ValidationError
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -12,10 +14,25 @@ from tenacity import (
 )
 
 from ptm.config import get_tavily_api_key
-from ptm.schemas import TavilySource
+from ptm.schemas import SOURCE_LIST, TavilySource
 
 TAVILY_API_BASE_URL = "https://api.tavily.com"
 
+# Last-segment ;params, query string and fragment, as urlparse splits them off
+_URL_STRIP_QUERY = re.compile(r"(?:;[^/?#]*)?(?:[?#].*)?$", re.DOTALL)
+
+
+def _normalize_url(url: str) -> str:
+    """Normalize a URL for deduplication by dropping params, query and fragment.
+
+    Args:
+        url: URL string
+
+    Returns:
+        URL reduced to scheme, netloc and path
+    """
+    return _URL_STRIP_QUERY.sub("", url, count=1)
+
 
 class TavilyClientError(Exception):
     """Base exception for Tavily client errors."""
@@ -81,7 +98,7 @@ class TavilyClient:
             with httpx.Client(timeout=self.timeout) as client:
                 response = client.post(url, json=payload, headers=headers)
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content)
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 401:
                 raise TavilyAuthError(
@@ -108,21 +125,30 @@ class TavilyClient:
         Returns:
             List of TavilySource objects
         """
-        sources = []
-        results = data.get("results", [])
+        items = [
+            {
+                "url": result.get("url", ""),
+                "title": result.get("title", ""),
+                "content": result.get("content", ""),
+                "score": result.get("score"),
+                "published_date": result.get("published_date"),
+            }
+            for result in data.get("results", [])
+            if isinstance(result, dict)
+        ]
+
+        try:
+            # Validate the whole page of results in one call
+            return SOURCE_LIST.validate_python(items)
+        except ValidationError:
+            pass
 
-        for result in results:
+        # Some results are invalid: validate one by one, skipping the bad ones
+        sources = []
+        for item in items:
             try:
-                source = TavilySource(
-                    url=result.get("url", ""),
-                    title=result.get("title", ""),
-                    content=result.get("content", ""),
-                    score=result.get("score"),
-                    published_date=result.get("published_date"),
-                )
-                sources.append(source)
-            except Exception:
-                # Skip invalid results but continue processing
+                sources.append(TavilySource.model_validate(item))
+            except ValidationError:
                 continue
 
         return sources
@@ -140,9 +166,7 @@ class TavilyClient:
         deduplicated = []
 
         for source in sources:
-            # Normalize URL by removing query params and fragments for comparison
-            parsed = urlparse(str(source.url))
-            normalized_url = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+            normalized_url = _normalize_url(str(source.url))
 
             if normalized_url not in seen_urls:
                 seen_urls.add(normalized_url)
@@ -0,0 +1,13 @@
+"""Schema adapters shared by the test modules.
+
+Building the TypeAdapter here compiles the verdict schema once, when the first
+test module imports this helper.
+"""
+
+from pydantic import TypeAdapter
+
+from ptm.schemas import PricingVerdict
+
+__all__ = ["VERDICT_TA"]
+
+VERDICT_TA = TypeAdapter(PricingVerdict)
@@ -0,0 +1,131 @@
+"""Shared pytest fixtures."""
+
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import pytest
+
+from ptm.config import _reset_cache
+from ptm.query_strategy import QueryStrategy
+from ptm.schemas import (
+    EvidenceBundle,
+    PricingVerdict,
+    ProductInput,
+    TavilySource,
+    VerdictStatus,
+)
+from ptm.tavily_client import TavilyClient
+
+HttpHandler = Callable[[httpx.Request], httpx.Response]
+
+# Captured before any test patches httpx.Client
+_REAL_HTTPX_CLIENT = httpx.Client
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    """Ensure each test resolves configuration from its own environment."""
+    _reset_cache()
+
+
+@pytest.fixture
+def route_httpx(monkeypatch: pytest.MonkeyPatch) -> Callable[[HttpHandler], None]:
+    """Route every httpx.Client created during the test through a handler.
+
+    Clients are real httpx clients backed by httpx.MockTransport, so the
+    production context-manager and error-handling paths still run.
+    """
+
+    def _route(handler: HttpHandler) -> None:
+        monkeypatch.setattr(
+            httpx,
+            "Client",
+            lambda *args, **kwargs: _REAL_HTTPX_CLIENT(
+                *args, transport=httpx.MockTransport(handler), **kwargs
+            ),
+        )
+
+    return _route
+
+
+@pytest.fixture(scope="session")
+def tavily_client() -> TavilyClient:
+    """Tavily client shared across the test session.
+
+    The client holds no connection state; tests choose its HTTP responses
+    per test through route_httpx.
+    """
+    return TavilyClient(api_key="test_key")
+
+
+@pytest.fixture(scope="session")
+def strategy(tavily_client: TavilyClient) -> QueryStrategy:
+    """Query strategy shared across the test session."""
+    return QueryStrategy(tavily_client)
+
+
+@pytest.fixture(scope="session")
+def pricing_source_factory() -> Callable[[str], TavilySource]:
+    """Factory for pricing-page sources with the given content.
+
+    Uses model_construct because the URL and title are fixed and known valid,
+    so per-test validation is unnecessary.
+    """
+
+    def _make(content: str) -> TavilySource:
+        return TavilySource.model_construct(
+            url="https://example.com/pricing",
+            title="Pricing",
+            content=content,
+        )
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def sample_product() -> ProductInput:
+    """A known-good product, built without validation."""
+    return ProductInput.model_construct(
+        name="Test Product",
+        url="https://example.com/",
+        current_price="$99/month",
+    )
+
+
+@pytest.fixture(scope="module")
+def sample_bundle(sample_product: ProductInput) -> EvidenceBundle:
+    """An evidence bundle holding only the sample product."""
+    return EvidenceBundle.model_construct(product_input=sample_product)
+
+
+@pytest.fixture(scope="module")
+def make_verdict(sample_bundle: EvidenceBundle) -> Callable[..., PricingVerdict]:
+    """Factory for FAIR verdicts on the sample bundle; keyword arguments override fields.
+
+    Uses model_construct, so overrides must already have their field types.
+    """
+
+    def _make(**overrides: Any) -> PricingVerdict:
+        fields = {
+            "status": VerdictStatus.FAIR,
+            "confidence": 0.8,
+            "competitor_count": 2,
+            "evidence_bundle": sample_bundle,
+        }
+        fields.update(overrides)
+        return PricingVerdict.model_construct(**fields)
+
+    return _make
+
+
+@pytest.fixture(scope="module")
+def base_verdict(
+    make_verdict: Callable[..., PricingVerdict], sample_bundle: EvidenceBundle
+) -> tuple[PricingVerdict, EvidenceBundle]:
+    """A FAIR verdict and its evidence bundle for a sample product.
+
+    Tests derive variants with model_copy(update=...) instead of rebuilding
+    and revalidating the nested models.
+    """
+    return make_verdict(), sample_bundle
@@ -1,5 +1,7 @@
 """Tests for competitor pricing aggregation."""
 
+import pytest
+
 from ptm.aggregation import (
     aggregate_competitor_pricing,
     get_comparable_competitors,
@@ -349,3 +351,56 @@ def test_get_comparable_competitors_partial_attribute_match() -> None:
     assert len(comparable) >= 1
     domains = {c.domain for c in comparable}
     assert "competitor1.com" in domains or "competitor2.com" in domains
+
+
+def test_get_comparable_competitors_limit() -> None:
+    """Test that limit caps the number of comparable competitors returned."""
+    from ptm.schemas import CompetitorPricing
+
+    competitors = [
+        CompetitorPricing(
+            domain=f"competitor{i}.com",
+            extracted_price_texts=[f"${99 + i}/month"],
+            normalized_monthly_usd=99.0 + i,
+        )
+        for i in range(5)
+    ]
+
+    unlimited = get_comparable_competitors(competitors, current_price_usd=100.0)
+    limited = get_comparable_competitors(competitors, current_price_usd=100.0, limit=2)
+
+    assert len(unlimited) == 5
+    assert limited == unlimited[:2]
+    assert len(get_comparable_competitors(competitors, limit=3)) == 3
+
+
+@pytest.mark.parametrize("current_price_usd", [None, 100.0])
+def test_get_comparable_competitors_negative_limit(current_price_usd: float | None) -> None:
+    """Test that a negative limit is rejected on both the priced and unpriced paths."""
+    from ptm.schemas import CompetitorPricing
+
+    competitors = [CompetitorPricing(domain="competitor.com", normalized_monthly_usd=99.0)]
+
+    with pytest.raises(ValueError, match="limit"):
+        get_comparable_competitors(competitors, current_price_usd=current_price_usd, limit=-1)
+
+
+def test_aggregate_competitor_pricing_many_domains() -> None:
+    """Test that batches with many domains keep domain order."""
+    sources = [
+        TavilySource(
+            url=f"https://competitor{i}.com/pricing",
+            title="Pricing",
+            content=f"Price: ${10 + i} per month",
+        )
+        for i in range(10)
+    ]
+
+    competitors = aggregate_competitor_pricing(sources)
+
+    assert [c.domain for c in competitors] == [
+        f"competitor{i}.com" for i in range(10)
+    ]
+    assert [c.normalized_monthly_usd for c in competitors] == [
+        float(10 + i) for i in range(10)
+    ]
@@ -9,6 +9,7 @@ from ptm.config import (
     get_openai_model,
     get_tavily_api_key,
     is_openai_available,
+    reload_config,
 )
 
 
@@ -59,3 +60,13 @@ def test_is_openai_available_true() -> None:
     """Test that is_openai_available returns True when key is present."""
     with patch.dict(os.environ, {"OPENAI_API_KEY": "test_key"}):
         assert is_openai_available() is True
+
+
+def test_config_values_cached_until_reload() -> None:
+    """Test that resolved values are reused until reload_config is called."""
+    with patch.dict(os.environ, {"OPENAI_MODEL": "gpt-4o"}):
+        assert get_openai_model() == "gpt-4o"
+        os.environ["OPENAI_MODEL"] = "gpt-4o-mini"
+        assert get_openai_model() == "gpt-4o"
+        reload_config()
+        assert get_openai_model() == "gpt-4o-mini"
@@ -1,5 +1,13 @@
 """Tests for pricing snippet extraction."""
 
+import re
+from collections import Counter
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from ptm import extraction
 from ptm.extraction import (
     extract_price_texts,
     extract_pricing_snippets,
@@ -7,14 +15,14 @@ from ptm.extraction import (
 )
 from ptm.schemas import TavilySource
 
+SourceFactory = Callable[[str], TavilySource]
+
 
-def test_extract_pricing_snippets_with_currency() -> None:
+def test_extract_pricing_snippets_with_currency(pricing_source_factory: SourceFactory) -> None:
     """Test extraction with currency symbols."""
     sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="Our pricing starts at $99 per month. Premium plan costs $199/month.",
+        pricing_source_factory(
+            "Our pricing starts at $99 per month. Premium plan costs $199/month."
         )
     ]
 
@@ -26,15 +34,9 @@ def test_extract_pricing_snippets_with_currency() -> None:
     assert any("$199" in s for s in snippets)
 
 
-def test_extract_pricing_snippets_starts_at() -> None:
+def test_extract_pricing_snippets_starts_at(pricing_source_factory: SourceFactory) -> None:
     """Test extraction with 'starts at' pattern."""
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="Pricing starts at $49.99 per month for the basic plan.",
-        )
-    ]
+    sources = [pricing_source_factory("Pricing starts at $49.99 per month for the basic plan.")]
 
     snippets = extract_pricing_snippets(sources)
 
@@ -43,15 +45,9 @@ def test_extract_pricing_snippets_starts_at() -> None:
     assert any("$49.99" in s for s in snippets)
 
 
-def test_extract_pricing_snippets_per_month() -> None:
+def test_extract_pricing_snippets_per_month(pricing_source_factory: SourceFactory) -> None:
     """Test extraction with 'per month' pattern."""
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="Basic plan: 29 USD per month. Pro plan: 99 USD per year.",
-        )
-    ]
+    sources = [pricing_source_factory("Basic plan: 29 USD per month. Pro plan: 99 USD per year.")]
 
     snippets = extract_pricing_snippets(sources)
 
@@ -59,14 +55,10 @@ def test_extract_pricing_snippets_per_month() -> None:
     assert any("per month" in s.lower() or "per year" in s.lower() for s in snippets)
 
 
-def test_extract_pricing_snippets_price_range() -> None:
+def test_extract_pricing_snippets_price_range(pricing_source_factory: SourceFactory) -> None:
     """Test extraction with price ranges."""
     sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="Our plans range from $99-$199 per month depending on features.",
-        )
+        pricing_source_factory("Our plans range from $99-$199 per month depending on features.")
     ]
 
     snippets = extract_pricing_snippets(sources)
@@ -75,33 +67,32 @@ def test_extract_pricing_snippets_price_range() -> None:
     assert any("$99" in s or "$199" in s for s in snippets)
 
 
-def test_extract_pricing_snippets_truncation() -> None:
+@pytest.mark.parametrize(
+    "long_content",
+    [
+        "Price: $99/month. " * 100,  # Very long content
+        # ~64 KB on one line with a few prices: the keyword-line snippet is the whole page
+        "Filler text. " * 5_000 + "Price: $99/month. " * 5,
+    ],
+    ids=["repeated_prices", "long_page"],
+)
+def test_extract_pricing_snippets_truncation(
+    pricing_source_factory: SourceFactory, long_content: str
+) -> None:
     """Test that snippets are truncated to safe length."""
-    long_content = "Price: $99/month. " * 100  # Very long content
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content=long_content,
-        )
-    ]
+    sources = [pricing_source_factory(long_content)]
 
     snippets = extract_pricing_snippets(sources)
 
     # All snippets should be truncated
+    assert any(snippet.endswith("...") for snippet in snippets)
     for snippet in snippets:
         assert len(snippet) <= 500  # MAX_SNIPPET_LENGTH
 
 
-def test_extract_pricing_snippets_deduplication() -> None:
+def test_extract_pricing_snippets_deduplication(pricing_source_factory: SourceFactory) -> None:
     """Test that duplicate snippets are removed."""
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="Price: $99/month. Price: $99/month.",  # Duplicate
-        )
-    ]
+    sources = [pricing_source_factory("Price: $99/month. Price: $99/month.")]  # Duplicate
 
     snippets = extract_pricing_snippets(sources)
 
@@ -110,6 +101,26 @@ def test_extract_pricing_snippets_deduplication() -> None:
     assert len(snippets) == len(unique_snippets)
 
 
+def test_extract_pricing_snippets_deduplication_many_sources(
+    pricing_source_factory: SourceFactory,
+) -> None:
+    """Test that heavily duplicated sources collapse to first-seen order."""
+    distinct = [pricing_source_factory(f"Plan {i} costs ${i}9/month.") for i in range(1, 6)]
+    # 500 sources, 5 unique contents, first seen in reverse order
+    sources = distinct[::-1] + distinct * 99
+
+    snippets = extract_pricing_snippets(sources)
+
+    raw = [
+        extraction._truncate_snippet(snippet)
+        for source in sources
+        for snippet in extraction._extract_with_heuristics(source.content)
+    ]
+    assert len(snippets) == len(set(snippets))
+    assert snippets == list(dict.fromkeys(raw))
+    assert snippets == extract_pricing_snippets(distinct[::-1])
+
+
 def test_extract_price_texts() -> None:
     """Test extraction of just price texts."""
     snippets = [
@@ -125,31 +136,32 @@ def test_extract_price_texts() -> None:
     assert any("$199" in text for text in price_texts)
 
 
-def test_extract_pricing_snippets_no_content() -> None:
-    """Test extraction with empty content."""
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content="",
-        )
+def test_extract_price_texts_no_cross_snippet_matches() -> None:
+    """Test that price texts never span two snippets and are deduplicated."""
+    snippets = [
+        "Basic plan: $99",
+        "per month billed annually",
+        "Pro plan: $99",
     ]
 
+    price_texts = extract_price_texts(snippets)
+
+    assert price_texts == ["$99"]
+
+
+def test_extract_pricing_snippets_no_content(pricing_source_factory: SourceFactory) -> None:
+    """Test extraction with empty content."""
+    sources = [pricing_source_factory("")]
+
     snippets = extract_pricing_snippets(sources)
 
     assert len(snippets) == 0
 
 
-def test_extract_pricing_snippets_verbatim_only() -> None:
+def test_extract_pricing_snippets_verbatim_only(pricing_source_factory: SourceFactory) -> None:
     """Test that snippets are verbatim from source (no generation)."""
     original_content = "Price: $99/month. This is our standard pricing."
-    sources = [
-        TavilySource(
-            url="https://example.com/pricing",
-            title="Pricing",
-            content=original_content,
-        )
-    ]
+    sources = [pricing_source_factory(original_content)]
 
     snippets = extract_pricing_snippets(sources)
 
@@ -162,13 +174,11 @@ def test_extract_pricing_snippets_verbatim_only() -> None:
         )
 
 
-def test_extract_product_attributes_category() -> None:
+def test_extract_product_attributes_category(pricing_source_factory: SourceFactory) -> None:
     """Test extraction of product category."""
     sources = [
-        TavilySource(
-            url="https://example.com/product",
-            title="Product",
-            content="This is a project management tool for teams. It helps you organize tasks and collaborate.",
+        pricing_source_factory(
+            "This is a project management tool for teams. It helps you organize tasks and collaborate."
         )
     ]
 
@@ -180,13 +190,11 @@ def test_extract_product_attributes_category() -> None:
     assert attributes["category"] is not None or len(attributes.get("key_features", [])) > 0
 
 
-def test_extract_product_attributes_target_customer() -> None:
+def test_extract_product_attributes_target_customer(pricing_source_factory: SourceFactory) -> None:
     """Test extraction of target customer segment."""
     sources = [
-        TavilySource(
-            url="https://example.com/product",
-            title="Product",
-            content="Designed for small businesses and teams. Perfect for startups looking to scale.",
+        pricing_source_factory(
+            "Designed for small businesses and teams. Perfect for startups looking to scale."
         )
     ]
 
@@ -198,13 +206,11 @@ def test_extract_product_attributes_target_customer() -> None:
     assert attributes["target_customer"] is not None or len(attributes.get("key_features", [])) > 0
 
 
-def test_extract_product_attributes_features() -> None:
+def test_extract_product_attributes_features(pricing_source_factory: SourceFactory) -> None:
     """Test extraction of key features."""
     sources = [
-        TavilySource(
-            url="https://example.com/product",
-            title="Product",
-            content="Features: Real-time collaboration, Cloud storage, Mobile app, API integration, Analytics and reporting.",
+        pricing_source_factory(
+            "Features: Real-time collaboration, Cloud storage, Mobile app, API integration, Analytics and reporting."
         )
     ]
 
@@ -217,15 +223,9 @@ def test_extract_product_attributes_features() -> None:
     assert len(attributes["key_features"]) >= 0
 
 
-def test_extract_product_attributes_no_content() -> None:
+def test_extract_product_attributes_no_content(pricing_source_factory: SourceFactory) -> None:
     """Test extraction with empty content."""
-    sources = [
-        TavilySource(
-            url="https://example.com/product",
-            title="Product",
-            content="",
-        )
-    ]
+    sources = [pricing_source_factory("")]
 
     attributes = extract_product_attributes(sources)
 
@@ -234,3 +234,114 @@ def test_extract_product_attributes_no_content() -> None:
     assert attributes["target_customer"] is None
     assert attributes["key_features"] == []
     assert attributes["product_description"] is None
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        "Acme is a ticketing helpdesk tool for support agents.",
+        "Acme is a\u00a0ticketing\u00a0helpdesk tool for\u00a0support agents",
+        "Type: ticketing suite\nBuilt for support agents\n",
+        "Includes: ticket routing, sla\u00a0tracking; canned replies. ✓ Shared inbox",
+        "Designed for legal clerks, with clause search and redlining.",
+    ],
+    ids=["ascii", "nbsp", "trailing_newline", "features_nbsp", "with_clause"],
+)
+def test_extract_product_attributes_same_under_re_and_re2(
+    monkeypatch: pytest.MonkeyPatch, pricing_source_factory: SourceFactory, content: str
+) -> None:
+    """Test that the optional RE2 engine extracts the same attributes as re."""
+    re2 = pytest.importorskip("re2")
+    sources = [pricing_source_factory(content)]
+
+    results = []
+    for engine in (re, re2):
+        category, customer, feature = extraction._compile_attribute_patterns(engine)
+        monkeypatch.setattr(extraction, "_CATEGORY_PATTERNS", category)
+        monkeypatch.setattr(extraction, "_CUSTOMER_PATTERNS", customer)
+        monkeypatch.setattr(extraction, "_FEATURE_PATTERNS", feature)
+        results.append(extract_product_attributes(sources))
+
+    assert results[0] == results[1]
+
+
+def test_extract_pricing_snippets_no_digits(pricing_source_factory: SourceFactory) -> None:
+    """Test that content without any digits yields no snippets."""
+    sources = [pricing_source_factory("Pricing plans for every team. Contact sales for a quote.")]
+
+    snippets = extract_pricing_snippets(sources)
+
+    assert snippets == []
+
+
+class _RecordingPattern:
+    """Proxy for a compiled pattern that records every string it scans."""
+
+    def __init__(self, name: str, pattern: re.Pattern[str], scans: list[tuple[str, str]]) -> None:
+        self._name = name
+        self._pattern = pattern
+        self._scans = scans
+
+    def __getattr__(self, attr: str) -> Any:
+        method = getattr(self._pattern, attr)
+        if attr not in ("search", "match", "finditer", "findall"):
+            return method
+
+        def recording(string: str, *args: Any, **kwargs: Any) -> Any:
+            self._scans.append((self._name, string))
+            return method(string, *args, **kwargs)
+
+        return recording
+
+
+@pytest.fixture
+def pattern_scans(monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+    """Record (pattern name, scanned string) for every scan by the extraction patterns."""
+    scans: list[tuple[str, str]] = []
+
+    # re.Pattern is immutable, so swap the module's compiled patterns for proxies
+    proxies = {}
+    for name, value in vars(extraction).items():
+        if isinstance(value, re.Pattern):
+            proxies[value] = _RecordingPattern(name, value, scans)
+            monkeypatch.setattr(extraction, name, proxies[value])
+    monkeypatch.setattr(
+        extraction, "_SNIPPET_PATTERNS", [proxies[p] for p in extraction._SNIPPET_PATTERNS]
+    )
+    monkeypatch.setattr(
+        extraction,
+        "_CURRENCY_SNIPPET_PATTERNS",
+        frozenset(proxies[p] for p in extraction._CURRENCY_SNIPPET_PATTERNS),
+    )
+    return scans
+
+
+@pytest.mark.parametrize("filler", ["Filler text. ", "Filler text.\n"])
+def test_extract_pricing_snippets_scales(
+    pricing_source_factory: SourceFactory, pattern_scans: list[tuple[str, str]], filler: str
+) -> None:
+    """Test that a ~100 KB page with one price is scanned once, not line by line."""
+    content = (filler * 8000) + "Price: $99/month."
+
+    snippets = extract_pricing_snippets([pricing_source_factory(content)])
+
+    whole_content_scans = Counter(name for name, string in pattern_scans if string == content)
+    line_scans = [string for name, string in pattern_scans if name == "_LINE_PRICE_RE"]
+    assert any("$99" in snippet for snippet in snippets)
+    assert max(whole_content_scans.values()) == 1
+    # Only the single keyword line reaches the per-line price check
+    assert len(line_scans) <= 1
+
+
+def test_extract_pricing_snippets_single_pass(
+    pricing_source_factory: SourceFactory, pattern_scans: list[tuple[str, str]]
+) -> None:
+    """Test that no pattern scans a source's content more than once."""
+    content = "Price: $99/month. " * 50
+
+    snippets = extract_pricing_snippets([pricing_source_factory(content)])
+
+    calls = Counter(name for name, string in pattern_scans if string == content)
+    assert snippets
+    assert calls
+    assert max(calls.values()) == 1
@@ -1,5 +1,9 @@
 """Tests for money parsing and cadence detection."""
 
+import re
+from dataclasses import FrozenInstanceError, replace
+
+import pytest
 
 from ptm.parsing import (
     ParsedPrice,
@@ -9,87 +13,68 @@ from ptm.parsing import (
 )
 
 
-def test_parse_price_basic() -> None:
-    """Test basic price parsing."""
-    price = parse_price("$99/month")
-    assert price is not None
-    assert price.amount == 99.0
-    assert price.currency == "USD"
-    assert price.cadence == "month"
-    assert not price.per_seat
-
-
-def test_parse_price_per_year() -> None:
-    """Test parsing yearly price."""
-    price = parse_price("€50 per year")
-    assert price is not None
-    assert price.amount == 50.0
-    assert price.currency == "EUR"
-    assert price.cadence == "year"
-
-
-def test_parse_price_per_seat() -> None:
-    """Test parsing per-seat price."""
-    price = parse_price("$10 per seat per month")
+@pytest.mark.parametrize(
+    ("text", "amount", "currency", "cadence", "per_seat"),
+    [
+        ("$99/month", 99.0, "USD", "month", False),
+        ("€50 per year", 50.0, "EUR", "year", False),
+        ("$10 per seat per month", 10.0, "USD", "month", True),
+        ("$1,234.56 per month", 1234.56, "USD", "month", False),
+        ("$20 per week", 20.0, "USD", "week", False),
+        ("$5 per day", 5.0, "USD", "day", False),
+        ("100 EUR per month", 100.0, "EUR", "month", False),
+    ],
+)
+def test_parse_price(
+    text: str, amount: float, currency: str, cadence: str, per_seat: bool
+) -> None:
+    """Test price parsing of amount, currency, cadence and per-seat flag."""
+    price = parse_price(text)
     assert price is not None
-    assert price.amount == 10.0
-    assert price.per_seat
-
-
-def test_parse_price_invalid() -> None:
-    """Test parsing invalid price."""
-    price = parse_price("Contact us for pricing")
-    assert price is None
-
-
-def test_parse_price_with_comma() -> None:
-    """Test parsing price with comma decimal separator."""
-    # Note: EU format might not parse correctly, but should handle basic cases
-    price2 = parse_price("$1,234.56 per month")
-    assert price2 is not None
-    assert price2.amount == 1234.56
-
-
-def test_normalize_to_monthly_usd_monthly() -> None:
-    """Test normalizing monthly USD price."""
-    parsed = ParsedPrice(
-        amount=99.0,
-        currency="USD",
-        cadence="month",
-        raw_text="$99/month",
-    )
-
-    normalized = normalize_to_monthly_usd(parsed)
-    assert normalized.monthly_usd == 99.0
-    assert len(normalized.gaps) == 0
-
-
-def test_normalize_to_monthly_usd_yearly() -> None:
-    """Test normalizing yearly price to monthly."""
-    parsed = ParsedPrice(
-        amount=1200.0,
-        currency="USD",
-        cadence="year",
-        raw_text="$1200/year",
-    )
-
-    normalized = normalize_to_monthly_usd(parsed)
-    assert normalized.monthly_usd == 100.0  # 1200 / 12
-    assert len(normalized.gaps) == 0
-
-
-def test_normalize_to_monthly_usd_missing_cadence() -> None:
-    """Test normalization with missing cadence - now assumes one-time purchase."""
+    assert price.amount == amount
+    assert price.currency == currency
+    assert price.cadence == cadence
+    assert price.per_seat is per_seat
+
+
+@pytest.mark.parametrize("text", ["Contact us for pricing", "Free", "", "   "])
+def test_parse_price_invalid(text: str) -> None:
+    """Test that text without a price is not parsed."""
+    assert parse_price(text) is None
+
+
+@pytest.mark.parametrize(
+    ("amount", "currency", "cadence", "per_seat", "seat_count", "fx_rates", "expected"),
+    [
+        (99.0, "USD", "month", False, None, None, 99.0),
+        (1200.0, "USD", "year", False, None, None, 100.0),  # 1200 / 12
+        (20.0, "USD", "week", False, None, None, 86.6),  # 20 * 4.33
+        (5.0, "USD", "day", False, None, None, 150.0),  # 5 * 30
+        # Missing cadence is assumed to be a one-time purchase
+        (99.0, "USD", None, False, None, None, 99.0),
+        (10.0, "USD", "month", True, 5, None, 50.0),  # 10 * 5 seats
+        (100.0, "EUR", "month", False, None, {"EUR": 1.1, "USD": 1.0}, 110.0),
+    ],
+)
+def test_normalize_to_monthly_usd(
+    amount: float,
+    currency: str,
+    cadence: str | None,
+    per_seat: bool,
+    seat_count: int | None,
+    fx_rates: dict[str, float] | None,
+    expected: float,
+) -> None:
+    """Test normalizing prices across cadences, seats and currencies."""
     parsed = ParsedPrice(
-        amount=99.0,
-        currency="USD",
-        cadence=None,
-        raw_text="$99",
+        amount=amount,
+        currency=currency,
+        cadence=cadence,
+        per_seat=per_seat,
     )
 
-    normalized = normalize_to_monthly_usd(parsed)
-    # Missing cadence is now assumed to be one-time purchase
-    assert normalized.monthly_usd == 99.0
+    normalized = normalize_to_monthly_usd(parsed, fx_rates=fx_rates, seat_count=seat_count)
+    assert normalized.monthly_usd == expected
     assert len(normalized.gaps) == 0
 
 
@@ -105,58 +90,50 @@ def test_normalize_to_monthly_usd_per_seat_without_count() -> None:
 
     normalized = normalize_to_monthly_usd(parsed)
     assert normalized.monthly_usd == 0.0
-    assert "seat count" in " ".join(normalized.gaps).lower()
-
+    assert any("seat count" in gap.lower() for gap in normalized.gaps)
 
-def test_normalize_to_monthly_usd_per_seat_with_count() -> None:
-    """Test normalization of per-seat price with seat count."""
-    parsed = ParsedPrice(
-        amount=10.0,
-        currency="USD",
-        cadence="month",
-        per_seat=True,
-        raw_text="$10/seat/month",
-    )
-
-    normalized = normalize_to_monthly_usd(parsed, seat_count=5)
-    assert normalized.monthly_usd == 50.0  # 10 * 5
-    assert len(normalized.gaps) == 0
 
+def test_normalize_missing_cadence_does_not_mutate_input() -> None:
+    """Test that assuming a one-time cadence leaves the parsed price untouched."""
+    parsed = ParsedPrice(amount=99.0, currency="USD")
 
-def test_normalize_to_monthly_usd_currency_conversion() -> None:
-    """Test normalization with currency conversion."""
-    parsed = ParsedPrice(
-        amount=100.0,
-        currency="EUR",
-        cadence="month",
-        raw_text="€100/month",
-    )
-
-    # Use custom FX rate
-    fx_rates = {"EUR": 1.1, "USD": 1.0}
-    normalized = normalize_to_monthly_usd(parsed, fx_rates=fx_rates)
-    assert normalized.monthly_usd == 110.0  # 100 * 1.1
-    assert len(normalized.gaps) == 0
-
-
-def test_detect_cadence_month() -> None:
-    """Test cadence detection for month."""
-    assert detect_cadence("$99 per month") == "month"
-    assert detect_cadence("$99/month") == "month"
-    assert detect_cadence("$99 monthly") == "month"
-
-
-def test_detect_cadence_year() -> None:
-    """Test cadence detection for year."""
-    assert detect_cadence("$1200 per year") == "year"
-    assert detect_cadence("$1200/year") == "year"
-    assert detect_cadence("$1200 yearly") == "year"
-
+    normalized = normalize_to_monthly_usd(parsed)
 
-def test_detect_cadence_none() -> None:
-    """Test cadence detection when not present."""
-    assert detect_cadence("$99") is None
-    assert detect_cadence("Contact us") is None
+    assert parsed.cadence is None
+    assert normalized.original_price == replace(parsed, cadence="one-time")
+
+
+def test_parsed_price_is_slotted() -> None:
+    """Test that ParsedPrice is a frozen, slotted dataclass."""
+    parsed = ParsedPrice(1.0, "USD")
+
+    assert not hasattr(parsed, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        parsed.cadence = "month"
+
+
+@pytest.mark.parametrize(
+    ("text", "expected"),
+    [
+        ("$99 per month", "month"),
+        ("$99/month", "month"),
+        ("$99 monthly", "month"),
+        ("$1200 per year", "year"),
+        ("$1200/year", "year"),
+        ("$1200 yearly", "year"),
+        ("$20 per week", "week"),
+        ("$20/week", "week"),
+        ("$20 weekly", "week"),
+        ("$5 per day", "day"),
+        ("$5/day", "day"),
+        ("$5 daily", "day"),
+        ("$99", None),
+        ("Contact us", None),
+    ],
+)
+def test_detect_cadence(text: str, expected: str | None) -> None:
+    """Test cadence detection."""
+    assert detect_cadence(text) == expected
 
 
 def test_parse_price_with_context() -> None:
@@ -187,3 +164,20 @@ def test_parse_price_context_priority() -> None:
     price = parse_price(price_text, context=context)
     assert price is not None
     assert price.cadence == "month"  # Price text should take priority
+
+
+def test_module_regexes_are_precompiled() -> None:
+    """Test that parsing and extraction patterns are compiled at import time."""
+    import ptm.extraction as extraction
+    import ptm.parsing as parsing
+
+    for pattern in (
+        parsing._US_AMOUNT_RE,
+        parsing._EU_AMOUNT_RE,
+        parsing._SIMPLE_AMOUNT_RE,
+        parsing._CURRENCY_CODE_RE,
+        *extraction._SNIPPET_PATTERNS,
+        extraction._LINE_PRICE_RE,
+        extraction._PRICE_TEXT_RE,
+    ):
+        assert isinstance(pattern, re.Pattern)
@@ -1,49 +1,31 @@
 """Tests for query strategy."""
 
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
 
 from ptm.query_strategy import QueryStrategy
 from ptm.schemas import ProductInput, TavilySource
-from ptm.tavily_client import TavilyClient
 
 
-def test_build_product_pricing_query() -> None:
+def test_build_product_pricing_query(strategy: QueryStrategy, sample_product: ProductInput) -> None:
     """Test building product pricing query."""
-    client = TavilyClient(api_key="test_key")
-    strategy = QueryStrategy(client)
-
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-
-    query = strategy._build_product_pricing_query(product)
+    query = strategy._build_product_pricing_query(sample_product)
     assert "Test Product" in query
     assert "pricing" in query.lower()
 
 
-def test_build_competitor_pricing_query() -> None:
+def test_build_competitor_pricing_query(
+    strategy: QueryStrategy, sample_product: ProductInput
+) -> None:
     """Test building competitor pricing query."""
-    client = TavilyClient(api_key="test_key")
-    strategy = QueryStrategy(client)
-
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-
-    query = strategy._build_competitor_pricing_query(product)
+    query = strategy._build_competitor_pricing_query(sample_product)
     assert "Test Product" in query
     assert "alternatives" in query.lower() or "competitors" in query.lower()
 
 
-@patch.object(TavilyClient, "search")
-def test_discover_pricing_sources(mock_search: Mock) -> None:
+def test_discover_pricing_sources(sample_product: ProductInput) -> None:
     """Test discovering pricing sources."""
-    # Mock Tavily search results
-    mock_search.return_value = [
+    # Stub Tavily client returning canned search results
+    results = [
         TavilySource(
             url="https://example.com/pricing",
             title="Pricing",
@@ -55,29 +37,24 @@ def test_discover_pricing_sources(mock_search: Mock) -> None:
             content="Some content",
         ),
     ]
+    queries = []
 
-    client = TavilyClient(api_key="test_key")
-    strategy = QueryStrategy(client)
+    def search(query: str, **kwargs: object) -> list[TavilySource]:
+        queries.append(query)
+        return results
 
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
+    strategy = QueryStrategy(SimpleNamespace(search=search))
 
-    sources = strategy.discover_pricing_sources(product)
+    sources = strategy.discover_pricing_sources(sample_product)
 
     # Should have executed multiple queries
-    assert mock_search.call_count >= 2
+    assert len(queries) >= 2
     # Should return sources (pricing URLs prioritized)
     assert len(sources) > 0
 
 
-def test_filter_pricing_urls() -> None:
+def test_filter_pricing_urls(strategy: QueryStrategy) -> None:
     """Test filtering pricing URLs."""
-    client = TavilyClient(api_key="test_key")
-    strategy = QueryStrategy(client)
-
     sources = [
         TavilySource(
             url="https://example.com/pricing",
@@ -104,11 +81,8 @@ def test_filter_pricing_urls() -> None:
     assert "/pricing" in str(filtered[0].url) or "/plans" in str(filtered[0].url)
 
 
-def test_filter_pricing_urls_deduplication() -> None:
+def test_filter_pricing_urls_deduplication(strategy: QueryStrategy) -> None:
     """Test that filter_pricing_urls deduplicates."""
-    client = TavilyClient(api_key="test_key")
-    strategy = QueryStrategy(client)
-
     sources = [
         TavilySource(
             url="https://example.com/pricing",
@@ -127,3 +101,18 @@ def test_filter_pricing_urls_deduplication() -> None:
 
     # Should deduplicate
     assert len(filtered) == 1
+
+
+def test_filter_pricing_urls_deduplication_many_sources(strategy: QueryStrategy) -> None:
+    """Test that thousands of copies of one URL collapse to a single source."""
+    source = TavilySource(
+        url="https://example.com/pricing",
+        title="Pricing",
+        content="Price: $99/month",
+    )
+    seen_urls = set()
+
+    filtered = strategy._filter_pricing_urls([source] * 10_000, seen_urls)
+
+    assert len(filtered) == 1
+    assert seen_urls == {str(source.url)}
@@ -1,72 +1,61 @@
 """Tests for Markdown report generator."""
 
+from collections.abc import Callable
 from pathlib import Path
-from tempfile import TemporaryDirectory
-
-from ptm.reporting import generate_markdown_report
-from ptm.schemas import (
-    EvidenceBundle,
-    PricingVerdict,
-    ProductInput,
-    VerdictStatus,
-)
-
-
-def test_generate_markdown_report() -> None:
-    """Test Markdown report generation."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-    bundle = EvidenceBundle(product_input=product)
-    verdict = PricingVerdict(
-        status=VerdictStatus.FAIR,
-        confidence=0.8,
+
+from pydantic import HttpUrl
+
+from ptm.reporting import generate_markdown_report, render_markdown_report
+from ptm.schemas import CompetitorPricing, EvidenceBundle, PricingVerdict
+
+
+def test_render_markdown_report(make_verdict: Callable[..., PricingVerdict]) -> None:
+    """Test Markdown report rendering."""
+    verdict = make_verdict(
         key_reasons=["Price is competitive"],
         gaps=["Missing FX rate for EUR"],
-        citations=["https://example.com/source1"],
-        competitor_count=2,
-        evidence_bundle=bundle,
+        citations=[HttpUrl("https://example.com/source1")],
     )
 
-    with TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.md"
-        generate_markdown_report(verdict, output_path)
+    content = render_markdown_report(verdict)
 
-        assert output_path.exists()
-        content = output_path.read_text(encoding="utf-8")
+    # Check key sections
+    assert "# 💰 Pricing Analysis Report" in content
+    assert "Test Product" in content
+    assert "$99/month" in content
+    assert "FAIR" in content
+    assert "80.0%" in content or "0.8" in content
+    assert "Price is competitive" in content
+    assert "Missing FX rate" in content
+    assert "https://example.com/source1" in content
+    assert "Disclaimer" in content
 
-        # Check key sections
-        assert "# Pricing Analysis Report" in content
-        assert "Test Product" in content
-        assert "$99/month" in content
-        assert "FAIR" in content
-        assert "80.0%" in content or "0.8" in content
-        assert "Price is competitive" in content
-        assert "Missing FX rate" in content
-        assert "https://example.com/source1" in content
-        assert "Disclaimer" in content
 
+def test_render_markdown_report_lists_gaps(make_verdict: Callable[..., PricingVerdict]) -> None:
+    """Test that data gaps get their own section, and only when there are any."""
+    with_gaps = render_markdown_report(
+        make_verdict(gaps=["Missing FX rate for EUR", "Missing cadence for competitor.com"])
+    )
+    without_gaps = render_markdown_report(make_verdict())
 
-def test_generate_markdown_report_with_competitors() -> None:
-    """Test report generation with competitor data."""
-    from ptm.schemas import CompetitorPricing
+    assert "### ⚠️ Gaps" in with_gaps
+    assert "- Missing FX rate for EUR" in with_gaps
+    assert "- Missing cadence for competitor.com" in with_gaps
+    assert "Gaps" not in without_gaps
 
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
 
+def test_render_markdown_report_with_competitors(
+    make_verdict: Callable[..., PricingVerdict], sample_bundle: EvidenceBundle
+) -> None:
+    """Test report generation with competitor data."""
     competitors = [
-        CompetitorPricing(
+        CompetitorPricing.model_construct(
             domain="competitor1.com",
             extracted_price_texts=["$95/month"],
             normalized_monthly_usd=95.0,
             evidence_snippets=["Price: $95/month"],
         ),
-        CompetitorPricing(
+        CompetitorPricing.model_construct(
             domain="competitor2.com",
             extracted_price_texts=["$105/month"],
             normalized_monthly_usd=105.0,
@@ -74,27 +63,27 @@ def test_generate_markdown_report_with_competitors() -> None:
         ),
     ]
 
-    bundle = EvidenceBundle(
-        product_input=product,
-        competitor_pricing=competitors,
-    )
+    bundle = sample_bundle.model_copy(update={"competitor_pricing": competitors})
+    verdict = make_verdict(evidence_bundle=bundle)
+
+    content = render_markdown_report(verdict)
+
+    # Check competitor table
+    assert "Competitor Comparison" in content
+    assert "competitor1.com" in content
+    assert "competitor2.com" in content
+    assert "$95.00" in content or "$95" in content
+    assert "$105.00" in content or "$105" in content
 
-    verdict = PricingVerdict(
-        status=VerdictStatus.FAIR,
-        confidence=0.8,
-        competitor_count=2,
-        evidence_bundle=bundle,
-    )
 
-    with TemporaryDirectory() as tmpdir:
-        output_path = Path(tmpdir) / "report.md"
-        generate_markdown_report(verdict, output_path)
+def test_generate_markdown_report_writes_file(
+    tmp_path: Path, make_verdict: Callable[..., PricingVerdict]
+) -> None:
+    """Test that the rendered report is written to the output path."""
+    output_path = tmp_path / "reports" / "report.md"
 
-        content = output_path.read_text(encoding="utf-8")
+    generate_markdown_report(make_verdict(), output_path)
 
-        # Check competitor table
-        assert "Competitor Comparison" in content
-        assert "competitor1.com" in content
-        assert "competitor2.com" in content
-        assert "$95.00" in content or "$95" in content
-        assert "$105.00" in content or "$105" in content
+    content = output_path.read_text(encoding="utf-8")
+    assert content.startswith("# 💰 Pricing Analysis Report")
+    assert "Disclaimer" in content
@@ -2,6 +2,7 @@
 
 import pytest
 from ptm.schemas import (
+    SOURCE_LIST,
     CompetitorPricing,
     EvidenceBundle,
     PricingVerdict,
@@ -9,7 +10,7 @@ from ptm.schemas import (
     TavilySource,
     VerdictStatus,
 )
-from pydantic import ValidationError
+from pydantic import BaseModel, HttpUrl, ValidationError
 
 
 def test_product_input_valid() -> None:
@@ -20,18 +21,24 @@ def test_product_input_valid() -> None:
         current_price="$99/month",
     )
     assert product.name == "Test Product"
-    assert str(product.url) == "https://example.com/product"
+    assert product.url == "https://example.com/product"
     assert product.current_price == "$99/month"
 
 
-def test_product_input_invalid_url() -> None:
-    """Test ProductInput with invalid URL."""
-    with pytest.raises(ValidationError):
-        ProductInput(
-            name="Test Product",
-            url="not-a-url",
-            current_price="$99/month",
-        )
+def test_product_input_url_is_normalized_string() -> None:
+    """Test that ProductInput keeps its URL as a validated, normalized string."""
+    product = ProductInput(name="Test", url="https://Example.com", current_price="$99")
+    assert product.url == "https://example.com/"
+    assert product.model_dump(mode="json")["url"] == "https://example.com/"
+
+
+def test_product_input_accepts_http_url_instance() -> None:
+    """Test that ProductInput still accepts an HttpUrl and keeps the uri schema format."""
+    product = ProductInput(
+        name="Test", url=HttpUrl("https://example.com/product"), current_price="$99"
+    )
+    assert product.url == "https://example.com/product"
+    assert ProductInput.model_json_schema()["properties"]["url"]["format"] == "uri"
 
 
 def test_tavily_source_valid() -> None:
@@ -58,76 +65,116 @@ def test_competitor_pricing_valid() -> None:
     assert pricing.normalized_monthly_usd == 99.0
 
 
-def test_competitor_pricing_invalid_price() -> None:
-    """Test CompetitorPricing with invalid normalized price."""
+def test_competitor_pricing_lowercased_attributes() -> None:
+    """Test that matching attributes are lowercased once at construction."""
+    pricing = CompetitorPricing(
+        domain="competitor.com",
+        category="Project Management",
+        key_features=[" Real-Time ", "API"],
+    )
+    assert pricing._lc_category == "project management"
+    assert pricing._lc_target_customer == ""
+    assert pricing._lc_key_features == ("real-time", "api")
+    assert "_lc_category" not in pricing.model_dump()
+
+
+def test_competitor_pricing_copy_recomputes_lowercased_attributes() -> None:
+    """Test that model_copy(update=...) does not carry stale lowercased attributes."""
+    pricing = CompetitorPricing(domain="competitor.com", category="CRM", key_features=["API"])
+
+    copied = pricing.model_copy(update={"category": "Email", "key_features": ["SMTP"]})
+
+    assert copied._lc_category == "email"
+    assert copied._lc_key_features == ("smtp",)
+    assert pricing._lc_category == "crm"
+
+
+@pytest.mark.parametrize(
+    ("model", "field"),
+    [
+        (ProductInput(name="Test", url="https://example.com", current_price="$99"), "name"),
+        (TavilySource(url="https://example.com", title="Pricing", content="$99"), "content"),
+        (CompetitorPricing(domain="competitor.com"), "domain"),
+    ],
+)
+def test_input_models_are_frozen(model: BaseModel, field: str) -> None:
+    """Test that input and evidence models reject assignment after construction."""
     with pytest.raises(ValidationError):
-        CompetitorPricing(
-            domain="competitor.com",
-            normalized_monthly_usd=-10.0,
-        )
+        setattr(model, field, "changed")
 
 
-def test_evidence_bundle_valid() -> None:
+def test_evidence_bundle_valid(sample_product: ProductInput) -> None:
     """Test valid EvidenceBundle."""
-    product = ProductInput(
-        name="Test",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-    bundle = EvidenceBundle(product_input=product)
-    assert bundle.product_input == product
+    bundle = EvidenceBundle(product_input=sample_product)
+    assert bundle.product_input == sample_product
     assert bundle.tavily_sources == []
     assert bundle.competitor_pricing == []
 
 
-def test_pricing_verdict_valid() -> None:
+def test_pricing_verdict_valid(sample_bundle: EvidenceBundle) -> None:
     """Test valid PricingVerdict."""
-    product = ProductInput(
-        name="Test",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-    bundle = EvidenceBundle(product_input=product)
     verdict = PricingVerdict(
         status=VerdictStatus.UNDETERMINABLE,
         confidence=0.5,
         competitor_count=0,
-        evidence_bundle=bundle,
+        evidence_bundle=sample_bundle,
     )
     assert verdict.status == VerdictStatus.UNDETERMINABLE
     assert verdict.confidence == 0.5
     assert verdict.competitor_count == 0
 
 
-def test_pricing_verdict_invalid_confidence() -> None:
-    """Test PricingVerdict with invalid confidence."""
-    product = ProductInput(
-        name="Test",
-        url="https://example.com",
-        current_price="$99/month",
+def test_verdict_status_is_plain_string(sample_bundle: EvidenceBundle) -> None:
+    """Test that verdict statuses compare and serialize as their string values."""
+    verdict = PricingVerdict(
+        status="FAIR",
+        confidence=0.5,
+        competitor_count=0,
+        evidence_bundle=sample_bundle,
     )
-    bundle = EvidenceBundle(product_input=product)
+    assert verdict.status is VerdictStatus.FAIR
+    assert verdict.status == "FAIR"
+    assert isinstance(verdict.status, str)
+    assert verdict.model_dump(mode="json")["status"] == "FAIR"
+
+
+@pytest.mark.parametrize(
+    ("model_cls", "kwargs"),
+    [
+        (ProductInput, {"name": "Test", "url": "not-a-url", "current_price": "$99/month"}),
+        (CompetitorPricing, {"domain": "competitor.com", "normalized_monthly_usd": -10.0}),
+        (
+            PricingVerdict,
+            {"status": VerdictStatus.UNDETERMINABLE, "confidence": 1.5, "competitor_count": 0},
+        ),
+        (
+            PricingVerdict,
+            {"status": VerdictStatus.UNDETERMINABLE, "confidence": 0.5, "competitor_count": -1},
+        ),
+    ],
+    ids=["invalid_url", "non_positive_price", "confidence_above_one", "negative_competitor_count"],
+)
+def test_validation_rejects(
+    model_cls: type[BaseModel], kwargs: dict, sample_bundle: EvidenceBundle
+) -> None:
+    """Test that validators reject out-of-range or malformed fields."""
+    if model_cls is PricingVerdict:
+        kwargs = {**kwargs, "evidence_bundle": sample_bundle}
+
     with pytest.raises(ValidationError):
-        PricingVerdict(
-            status=VerdictStatus.UNDETERMINABLE,
-            confidence=1.5,  # Invalid: > 1.0
-            competitor_count=0,
-            evidence_bundle=bundle,
-        )
+        model_cls(**kwargs)
 
 
-def test_pricing_verdict_invalid_competitor_count() -> None:
-    """Test PricingVerdict with invalid competitor count."""
-    product = ProductInput(
-        name="Test",
-        url="https://example.com",
-        current_price="$99/month",
+def test_source_list_validates_in_bulk() -> None:
+    """Test that the source list adapter validates every element in one call."""
+    sources = SOURCE_LIST.validate_python(
+        [
+            {"url": "https://a.com/pricing", "title": "Pricing", "content": "$9/month"},
+            {"url": "https://b.com/pricing", "title": "Plans", "content": "$19/month"},
+        ]
     )
-    bundle = EvidenceBundle(product_input=product)
+
+    assert [str(s.url) for s in sources] == ["https://a.com/pricing", "https://b.com/pricing"]
+
     with pytest.raises(ValidationError):
-        PricingVerdict(
-            status=VerdictStatus.UNDETERMINABLE,
-            confidence=0.5,
-            competitor_count=-1,  # Invalid: < 0
-            evidence_bundle=bundle,
-        )
+        SOURCE_LIST.validate_python([{"url": "not-a-url", "title": "Pricing", "content": "$9"}])
@@ -1,129 +1,155 @@
 """Tests for Tavily client."""
 
-from unittest.mock import Mock, patch
+from collections.abc import Callable
+from dataclasses import dataclass
 
 import httpx
 import pytest
-from ptm.tavily_client import TavilyAuthError, TavilyClient, TavilyClientError
+from ptm.schemas import TavilySource
+from ptm.tavily_client import (
+    TavilyAuthError,
+    TavilyClient,
+    TavilyClientError,
+    _normalize_url,
+)
 
+HttpRouter = Callable[[Callable[[httpx.Request], httpx.Response]], None]
 
-def test_tavily_client_init_with_key() -> None:
+
+def test_tavily_client_init_with_key(tavily_client: TavilyClient) -> None:
     """Test TavilyClient initialization with explicit API key."""
-    client = TavilyClient(api_key="test_key")
-    assert client.api_key == "test_key"
+    assert tavily_client.api_key == "test_key"
 
 
-@patch("ptm.tavily_client.get_tavily_api_key")
-def test_tavily_client_init_without_key(mock_get_key: Mock) -> None:
+def test_tavily_client_init_without_key(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test TavilyClient initialization without explicit API key."""
-    mock_get_key.return_value = "config_key"
+    monkeypatch.setattr("ptm.tavily_client.get_tavily_api_key", lambda: "config_key")
     client = TavilyClient()
     assert client.api_key == "config_key"
 
 
-@patch("httpx.Client")
-def test_tavily_search_success(mock_client_class: Mock) -> None:
-    """Test successful Tavily search."""
-    # Mock response
-    mock_response = Mock()
-    mock_response.json.return_value = {
-        "results": [
-            {
-                "url": "https://example.com/pricing",
-                "title": "Pricing Page",
-                "content": "Price: $99/month",
-                "score": 0.95,
-            }
-        ]
-    }
-    mock_response.raise_for_status = Mock()
+@dataclass(frozen=True)
+class SearchScenario:
+    """A canned Tavily API behaviour and the expected search outcome."""
+
+    handler: Callable[[httpx.Request], httpx.Response]
+    expects_raise: type[Exception] | None = None
+    match: str | None = None
+    check: Callable[[list[TavilySource]], None] | None = None
 
-    # Mock client
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.post.return_value = mock_response
-    mock_client_class.return_value = mock_client
 
-    client = TavilyClient(api_key="test_key")
-    sources = client.search("test query")
+def _results(*results: dict) -> Callable[[httpx.Request], httpx.Response]:
+    """Handler answering every search with the given results."""
+    return lambda request: httpx.Response(200, json={"results": list(results)})
 
+
+def _check_single_pricing_page(sources: list[TavilySource]) -> None:
+    """Check the one pricing page was parsed field by field."""
     assert len(sources) == 1
     assert str(sources[0].url) == "https://example.com/pricing"
     assert sources[0].title == "Pricing Page"
     assert sources[0].content == "Price: $99/month"
 
 
-@patch("httpx.Client")
-def test_tavily_search_auth_error(mock_client_class: Mock) -> None:
-    """Test Tavily search with authentication error."""
-    # Mock response with 401
-    mock_response = Mock()
-    mock_response.status_code = 401
-    mock_response.text = "Unauthorized"
-
-    # Mock client
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.post.side_effect = httpx.HTTPStatusError(
-        "Unauthorized", request=Mock(), response=mock_response
-    )
-    mock_client_class.return_value = mock_client
-
-    client = TavilyClient(api_key="test_key")
-
-    with pytest.raises(TavilyAuthError, match="authentication failed"):
-        client.search("test query")
+def _check_deduplicated(sources: list[TavilySource]) -> None:
+    """Check that query-string variants of one URL collapse to a single result."""
+    assert len(sources) == 1
 
 
-@patch("httpx.Client")
-def test_tavily_search_deduplication(mock_client_class: Mock) -> None:
-    """Test that Tavily search deduplicates results by URL."""
-    # Mock response with duplicate URLs
-    mock_response = Mock()
-    mock_response.json.return_value = {
+def _timeout(request: httpx.Request) -> httpx.Response:
+    """Handler simulating a request timeout."""
+    raise httpx.TimeoutException("Request timed out", request=request)
+
+
+SUCCESS = SearchScenario(
+    handler=_results(
+        {
+            "url": "https://example.com/pricing",
+            "title": "Pricing Page",
+            "content": "Price: $99/month",
+            "score": 0.95,
+        }
+    ),
+    check=_check_single_pricing_page,
+)
+AUTH_ERROR = SearchScenario(
+    handler=lambda request: httpx.Response(401, text="Unauthorized"),
+    expects_raise=TavilyAuthError,
+    match="authentication failed",
+)
+DEDUPLICATION = SearchScenario(
+    handler=_results(
+        {
+            "url": "https://example.com/pricing",
+            "title": "Pricing Page 1",
+            "content": "Price: $99/month",
+        },
+        {
+            "url": "https://example.com/pricing?ref=test",
+            "title": "Pricing Page 2",
+            "content": "Price: $99/month",
+        },
+    ),
+    check=_check_deduplicated,
+)
+TIMEOUT = SearchScenario(
+    handler=_timeout,
+    expects_raise=TavilyClientError,
+    match="timed out",
+)
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    [SUCCESS, AUTH_ERROR, DEDUPLICATION, TIMEOUT],
+    ids=["success", "auth_error", "deduplication", "timeout"],
+)
+def test_tavily_search(
+    scenario: SearchScenario, route_httpx: HttpRouter, tavily_client: TavilyClient
+) -> None:
+    """Test Tavily search against canned API responses."""
+    route_httpx(scenario.handler)
+
+    if scenario.expects_raise:
+        with pytest.raises(scenario.expects_raise, match=scenario.match):
+            tavily_client.search("test query")
+    else:
+        sources = tavily_client.search("test query")
+        scenario.check(sources)
+
+
+def test_tavily_parse_response_skips_invalid_results(tavily_client: TavilyClient) -> None:
+    """Test that invalid results are dropped while valid ones are kept."""
+    data = {
         "results": [
-            {
-                "url": "https://example.com/pricing",
-                "title": "Pricing Page 1",
-                "content": "Price: $99/month",
-            },
-            {
-                "url": "https://example.com/pricing?ref=test",
-                "title": "Pricing Page 2",
-                "content": "Price: $99/month",
-            },
+            {"url": "https://example.com/pricing", "title": "Pricing", "content": "$99"},
+            {"url": "not-a-url", "title": "Broken", "content": "$10"},
+            {"url": "https://other.com/plans", "content": "$49"},  # Missing title
+            None,
         ]
     }
-    mock_response.raise_for_status = Mock()
-
-    # Mock client
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.post.return_value = mock_response
-    mock_client_class.return_value = mock_client
-
-    client = TavilyClient(api_key="test_key")
-    sources = client.search("test query")
-
-    # Should deduplicate to 1 result
-    assert len(sources) == 1
-
-
-@patch("httpx.Client")
-def test_tavily_search_timeout(mock_client_class: Mock) -> None:
-    """Test Tavily search with timeout error."""
-    # Mock client that raises timeout
-    mock_client = Mock()
-    mock_client.__enter__ = Mock(return_value=mock_client)
-    mock_client.__exit__ = Mock(return_value=False)
-    mock_client.post.side_effect = httpx.TimeoutException("Request timed out")
-    mock_client_class.return_value = mock_client
-
-    client = TavilyClient(api_key="test_key")
 
-    # Should retry and eventually raise TavilyClientError
-    with pytest.raises(TavilyClientError, match="timed out"):
-        client.search("test query")
+    sources = tavily_client._parse_response(data)
+
+    assert [str(s.url) for s in sources] == [
+        "https://example.com/pricing",
+        "https://other.com/plans",
+    ]
+    assert sources[1].title == ""
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://example.com/pricing", "https://example.com/pricing"),
+        ("https://example.com/pricing?ref=test", "https://example.com/pricing"),
+        ("https://example.com/pricing#plans", "https://example.com/pricing"),
+        ("https://example.com/pricing?a=1#b?c", "https://example.com/pricing"),
+        ("https://a.com/p;jsessionid=1?x=2", "https://a.com/p"),
+        ("https://a.com/p;jsessionid=1", "https://a.com/p"),
+        ("https://a.com/x;v=1/p?q=;y", "https://a.com/x;v=1/p"),
+    ],
+)
+def test_normalize_url(url: str, expected: str) -> None:
+    """Test that dedup normalization strips params, query strings and fragments."""
+    assert _normalize_url(url) == expected
@@ -10,36 +10,43 @@ from ptm.schemas import (
 from ptm.verdict import compute_verdict
 
 
-def test_compute_verdict_underpriced() -> None:
-    """Test verdict for underpriced product."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$50/month",
+def _competitor(domain: str, monthly_usd: float) -> CompetitorPricing:
+    """Build a known-good monthly competitor price without validation."""
+    return CompetitorPricing.model_construct(
+        domain=domain,
+        extracted_price_texts=[f"${monthly_usd:g}/month"],
+        normalized_monthly_usd=monthly_usd,
+    )
+
+
+def _pricing_source(domain: str, content: str) -> TavilySource:
+    """Build a known-good pricing-page source without validation."""
+    return TavilySource.model_construct(
+        url=f"https://{domain}/pricing",
+        title="Pricing",
+        content=content,
     )
 
+
+# Known-good evidence for the confidence test, built once at import
+_FIVE_COMPETITORS = tuple(_competitor(f"competitor{i}.com", 99.0 + i) for i in range(5))
+_TEN_SOURCES = tuple(
+    _pricing_source(f"competitor{i}.com", f"Price: ${99 + i}/month") for i in range(10)
+)
+
+
+def test_compute_verdict_underpriced(sample_product: ProductInput) -> None:
+    """Test verdict for underpriced product."""
+    product = sample_product.model_copy(update={"current_price": "$50/month"})
+
     competitors = [
-        CompetitorPricing(
-            domain="competitor1.com",
-            extracted_price_texts=["$99/month"],
-            normalized_monthly_usd=99.0,
-        ),
-        CompetitorPricing(
-            domain="competitor2.com",
-            extracted_price_texts=["$100/month"],
-            normalized_monthly_usd=100.0,
-        ),
+        _competitor("competitor1.com", 99.0),
+        _competitor("competitor2.com", 100.0),
     ]
 
-    bundle = EvidenceBundle(
+    bundle = EvidenceBundle.model_construct(
         product_input=product,
-        tavily_sources=[
-            TavilySource(
-                url="https://competitor1.com/pricing",
-                title="Pricing",
-                content="Price: $99/month",
-            )
-        ],
+        tavily_sources=[_pricing_source("competitor1.com", "Price: $99/month")],
         competitor_pricing=competitors,
     )
 
@@ -50,28 +57,16 @@ def test_compute_verdict_underpriced() -> None:
     assert verdict.competitor_count == 2
 
 
-def test_compute_verdict_overpriced() -> None:
+def test_compute_verdict_overpriced(sample_product: ProductInput) -> None:
     """Test verdict for overpriced product."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$150/month",
-    )
+    product = sample_product.model_copy(update={"current_price": "$150/month"})
 
     competitors = [
-        CompetitorPricing(
-            domain="competitor1.com",
-            extracted_price_texts=["$99/month"],
-            normalized_monthly_usd=99.0,
-        ),
-        CompetitorPricing(
-            domain="competitor2.com",
-            extracted_price_texts=["$100/month"],
-            normalized_monthly_usd=100.0,
-        ),
+        _competitor("competitor1.com", 99.0),
+        _competitor("competitor2.com", 100.0),
     ]
 
-    bundle = EvidenceBundle(
+    bundle = EvidenceBundle.model_construct(
         product_input=product,
         competitor_pricing=competitors,
     )
@@ -82,112 +77,65 @@ def test_compute_verdict_overpriced() -> None:
     assert verdict.confidence > 0.0
 
 
-def test_compute_verdict_fair() -> None:
+def test_compute_verdict_fair(sample_product: ProductInput) -> None:
     """Test verdict for fairly priced product."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-
     competitors = [
-        CompetitorPricing(
-            domain="competitor1.com",
-            extracted_price_texts=["$95/month"],
-            normalized_monthly_usd=95.0,
-        ),
-        CompetitorPricing(
-            domain="competitor2.com",
-            extracted_price_texts=["$105/month"],
-            normalized_monthly_usd=105.0,
-        ),
+        _competitor("competitor1.com", 95.0),
+        _competitor("competitor2.com", 105.0),
     ]
 
-    bundle = EvidenceBundle(
-        product_input=product,
+    bundle = EvidenceBundle.model_construct(
+        product_input=sample_product,
         competitor_pricing=competitors,
     )
 
-    verdict = compute_verdict(product, bundle)
+    verdict = compute_verdict(sample_product, bundle)
 
     assert verdict.status == VerdictStatus.FAIR
     assert verdict.confidence > 0.0
 
 
-def test_compute_verdict_undeterminable_insufficient_competitors() -> None:
+def test_compute_verdict_undeterminable_insufficient_competitors(
+    sample_product: ProductInput,
+) -> None:
     """Test verdict when insufficient competitors."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-
     competitors = [
-        CompetitorPricing(
-            domain="competitor1.com",
-            extracted_price_texts=["$99/month"],
-            normalized_monthly_usd=99.0,
-        ),
+        _competitor("competitor1.com", 99.0),
     ]
 
-    bundle = EvidenceBundle(
-        product_input=product,
+    bundle = EvidenceBundle.model_construct(
+        product_input=sample_product,
         competitor_pricing=competitors,
     )
 
-    verdict = compute_verdict(product, bundle)
+    verdict = compute_verdict(sample_product, bundle)
 
     assert verdict.status == VerdictStatus.UNDETERMINABLE
-    assert "at least 2" in " ".join(verdict.key_reasons).lower()
+    assert any("at least 2" in reason.lower() for reason in verdict.key_reasons)
 
 
-def test_compute_verdict_undeterminable_unparseable_price() -> None:
+def test_compute_verdict_undeterminable_unparseable_price(sample_product: ProductInput) -> None:
     """Test verdict when current price cannot be parsed."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="Contact us for pricing",
-    )
+    product = sample_product.model_copy(update={"current_price": "Contact us for pricing"})
 
-    bundle = EvidenceBundle(product_input=product)
+    bundle = EvidenceBundle.model_construct(product_input=product)
 
     verdict = compute_verdict(product, bundle)
 
     assert verdict.status == VerdictStatus.UNDETERMINABLE
-    assert "parse" in " ".join(verdict.key_reasons).lower()
+    assert any("parse" in reason.lower() for reason in verdict.key_reasons)
 
 
-def test_compute_verdict_confidence_calculation() -> None:
+def test_compute_verdict_confidence_calculation(sample_product: ProductInput) -> None:
     """Test that confidence is calculated correctly."""
-    product = ProductInput(
-        name="Test Product",
-        url="https://example.com",
-        current_price="$99/month",
-    )
-
-    competitors = [
-        CompetitorPricing(
-            domain=f"competitor{i}.com",
-            extracted_price_texts=[f"${99 + i}/month"],
-            normalized_monthly_usd=99.0 + i,
-        )
-        for i in range(5)  # 5 competitors for high confidence
-    ]
-
-    bundle = EvidenceBundle(
-        product_input=product,
-        tavily_sources=[
-            TavilySource(
-                url=f"https://competitor{i}.com/pricing",
-                title="Pricing",
-                content=f"Price: ${99 + i}/month",
-            )
-            for i in range(10)  # 10 sources
-        ],
-        competitor_pricing=competitors,
+    # 5 competitors and 10 sources for high confidence
+    bundle = EvidenceBundle.model_construct(
+        product_input=sample_product,
+        tavily_sources=list(_TEN_SOURCES),
+        competitor_pricing=list(_FIVE_COMPETITORS),
     )
 
-    verdict = compute_verdict(product, bundle)
+    verdict = compute_verdict(sample_product, bundle)
 
     # Should have higher confidence with more competitors and sources
     assert verdict.confidence > 0.5